@@ -0,0 +1,163 @@
+# Backtest rolling-origin atas histori monthly_hotspot_sum.csv: untuk setiap
+# origin (default tiap Januari), forecaster dilatih dengan semua bulan sebelum
+# origin lalu diuji pada `horizon` bulan berikutnya. Origin dijalankan paralel
+# di process pool dan hasilnya disimpan di .cache/backtest/ (Arrow) dengan key
+# hash file histori + konfigurasi, sehingga tidak dihitung ulang tiap rerun.
+# Build manual (paralel) saat deploy: python backtest.py
+import functools
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pandas as pd
+import numpy as np
+
+from baselines import BASELINES
+from data_pipeline import SOURCE_FILES, tile_columns
+from dataset_cache import CACHE_DIR, CACHE_SUFFIX, file_digest, prune_cache, read_cache, write_cache
+from metric_engine import METRICS, MetricEngine
+from quartile_thresholds import compute_quartile_thresholds
+from tile_geometry import TileIndex
+
+BACKTEST_DIR = os.path.join(CACHE_DIR, 'backtest')
+
+# Naikkan jika logika forecaster/metrik atau konstanta modul (mis. SEASON_LENGTH)
+# berubah tanpa mengubah parameter fungsi, agar hasil backtest lama tidak dipakai
+BACKTEST_VERSION = 1
+
+# Panjang horizon forecast (bulan), jarak antar origin dan minimal bulan latih
+DEFAULT_HORIZON = 12
+DEFAULT_STEP = 12
+MIN_TRAIN_MONTHS = 12
+
+
+def history_matrix(historical_df, tile_ids):
+    """
+    Matriks histori bulan x tile dari file wide monthly_hotspot_sum.csv.
+
+    Returns:
+        (months, values): DatetimeIndex bulan terurut dan array (n_months, n_tiles)
+    """
+    months = pd.to_datetime(historical_df['year_month'])
+    values = historical_df[tile_columns(tile_ids)].to_numpy(dtype=float)
+    order = np.argsort(months.to_numpy(), kind='stable')
+    return pd.DatetimeIndex(months.to_numpy()[order]), values[order]
+
+
+# Forecaster bawaan: baseline (fungsi level modul, bisa dikirim ke process pool)
+FORECASTERS = dict(BASELINES)
+
+
+def rolling_origins(months, horizon=DEFAULT_HORIZON, step=DEFAULT_STEP,
+                    min_train=MIN_TRAIN_MONTHS, origin_month=1):
+    """Posisi origin: bulan `origin_month` dengan cukup data latih dan horizon penuh"""
+    positions = np.flatnonzero(months.month == origin_month)
+    positions = positions[(positions >= min_train) & (positions + horizon <= len(months))]
+    if len(positions) == 0:
+        return positions
+    return positions[(positions - positions[0]) % step == 0]
+
+
+def evaluate_origin(forecaster, values, months, tile_ids, origin, horizon):
+    """
+    Jalankan satu forecaster pada satu origin dan hitung metriknya.
+
+    Threshold kuartil untuk hit-rate kategori diambil dari 12 bulan terakhir
+    data latih (tanpa melihat data uji).
+    """
+    history = values[:origin]
+    actual = values[origin:origin + horizon]
+    forecast = np.asarray(forecaster(history, horizon), dtype=float)
+
+    engine = MetricEngine(
+        actual.T, tile_ids, months[origin:origin + horizon],
+        quartiles=compute_quartile_thresholds(history[-12:])
+    )
+    overall = engine.score(forecast.T[np.newaxis])['overall']
+    return {metric: float(overall[metric][0]) for metric in METRICS}
+
+
+def _run_task(task):
+    name, forecaster, values, months, tile_ids, origin, horizon = task
+    row = {'model': name, 'origin': months[origin], 'train_months': int(origin)}
+    row.update(evaluate_origin(forecaster, values, months, tile_ids, origin, horizon))
+    return row
+
+
+def run_backtest(values, months, tile_ids, forecasters=None, horizon=DEFAULT_HORIZON,
+                 step=DEFAULT_STEP, min_train=MIN_TRAIN_MONTHS, max_workers=None):
+    """
+    Backtest rolling-origin untuk semua forecaster x origin.
+
+    Setiap pasangan (forecaster, origin) menjadi satu task di ProcessPoolExecutor
+    (worker di-spawn, bukan fork); max_workers=1 menjalankan semuanya secara
+    serial di proses ini. Pool hanya untuk CLI/prebuild: dari server Streamlit
+    selalu pakai max_workers=1 (script dashboard adalah __main__ di sana, jadi
+    worker spawn akan menjalankan ulang dashboard).
+
+    Returns:
+        DataFrame kolom model, origin, train_months dan metrik (METRICS)
+    """
+    forecasters = FORECASTERS if forecasters is None else forecasters
+    origins = rolling_origins(months, horizon, step, min_train)
+    tasks = [
+        (name, forecaster, values, months, tile_ids, int(origin), horizon)
+        for name, forecaster in forecasters.items()
+        for origin in origins
+    ]
+    if max_workers == 1 or len(tasks) <= 1:
+        rows = [_run_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context('spawn')) as pool:
+            rows = list(pool.map(_run_task, tasks))
+    columns = ['model', 'origin', 'train_months'] + list(METRICS)
+    return pd.DataFrame(rows, columns=columns)
+
+
+def forecaster_key(fn):
+    """Identitas forecaster untuk key cache: nama fungsi + parameter (default/partial)"""
+    if isinstance(fn, functools.partial):
+        return f'{forecaster_key(fn.func)}{fn.args!r}{sorted(fn.keywords.items())!r}'
+    return f'{fn.__qualname__}{getattr(fn, "__defaults__", None)!r}{getattr(fn, "__kwdefaults__", None)!r}'
+
+
+def backtest_fingerprint(forecasters, horizon, step, min_train, source_files=SOURCE_FILES):
+    """Hash file histori/tile + konfigurasi backtest (termasuk parameter forecaster)"""
+    names = ','.join(f'{name}={forecaster_key(fn)}' for name, fn in forecasters.items())
+    digest = hashlib.sha256(
+        f'v{BACKTEST_VERSION}|{names}|h={horizon}|s={step}|m={min_train}'.encode()
+    )
+    for key in ('historical', 'tiles'):
+        file_digest(digest, key, source_files[key])
+    return digest.hexdigest()[:16]
+
+
+def load_backtest(forecasters=None, horizon=DEFAULT_HORIZON, step=DEFAULT_STEP,
+                  min_train=MIN_TRAIN_MONTHS, source_files=SOURCE_FILES,
+                  backtest_dir=BACKTEST_DIR, max_workers=None):
+    """Hasil backtest dari cache on-disk (dihitung lalu disimpan jika belum ada)"""
+    forecasters = FORECASTERS if forecasters is None else forecasters
+    fingerprint = backtest_fingerprint(forecasters, horizon, step, min_train, source_files)
+    path = os.path.join(backtest_dir, f'backtest_{fingerprint}{CACHE_SUFFIX}')
+    if os.path.exists(path):
+        return read_cache(path)
+
+    tile_ids = TileIndex.from_csv(source_files['tiles']).ids
+    months, values = history_matrix(pd.read_csv(source_files['historical']), tile_ids)
+    result = run_backtest(values, months, tile_ids, forecasters, horizon, step, min_train,
+                          max_workers)
+    write_cache(result, path)
+    # Hasil backtest konfigurasi/histori lama tidak dipakai lagi
+    prune_cache([path], backtest_dir)
+    return result
+
+
+def main():
+    """Jalankan backtest dari command line"""
+    result = load_backtest()
+    print(result.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
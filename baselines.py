@@ -0,0 +1,95 @@
+import pandas as pd
+import numpy as np
+
+# Semua baseline: fungsi level modul (history, horizon) -> array (horizon, n_tiles).
+# history adalah matriks bulan x tile yang berakhir tepat sebelum bulan forecast
+# pertama; semua tile dihitung sekaligus sebagai operasi array. History kosong
+# menghasilkan forecast NaN dengan bentuk yang sama.
+
+SEASON_LENGTH = 12
+MOVING_AVERAGE_WINDOW = 3
+SMOOTHING_ALPHA = 0.3
+
+
+def _missing_forecast(history, horizon):
+    """Forecast NaN (horizon, n_tiles) untuk history yang terlalu pendek"""
+    return np.full((horizon, history.shape[1]), np.nan)
+
+
+def seasonal_naive(history, horizon):
+    """Forecast = nilai bulan yang sama pada 12 bulan terakhir"""
+    if len(history) == 0:
+        return _missing_forecast(history, horizon)
+    if len(history) < SEASON_LENGTH:
+        return np.repeat(history[-1:], horizon, axis=0)
+    # np.resize mengulang baris musim jika horizon > 12
+    return np.resize(history[-SEASON_LENGTH:], (horizon, history.shape[1]))
+
+
+def moving_average(history, horizon, window=MOVING_AVERAGE_WINDOW):
+    """Forecast datar = rata-rata `window` bulan terakhir"""
+    if len(history) == 0:
+        return _missing_forecast(history, horizon)
+    level = history[-window:].mean(axis=0)
+    return np.repeat(level[np.newaxis], horizon, axis=0)
+
+
+def climatology(history, horizon):
+    """
+    Rata-rata klimatologis per bulan-dalam-tahun per tile.
+
+    Fase musim dihitung dari posisi terhadap akhir history, jadi bulan forecast
+    ke-h memakai rata-rata semua bulan history yang berjarak kelipatan 12.
+    """
+    n = len(history)
+    phase = (np.arange(n) - n) % SEASON_LENGTH
+    counts = np.bincount(phase, minlength=SEASON_LENGTH)
+    sums = np.zeros((SEASON_LENGTH, history.shape[1]))
+    np.add.at(sums, phase, history)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts[:, np.newaxis]
+    return means[np.arange(horizon) % SEASON_LENGTH]
+
+
+def exponential_smoothing(history, horizon, alpha=SMOOTHING_ALPHA):
+    """
+    Simple exponential smoothing (level diinisialisasi dengan bulan pertama).
+
+    Level akhir dihitung langsung sebagai rata-rata berbobot seluruh history
+    (bobot alpha * (1 - alpha)^k), tanpa loop per bulan.
+    """
+    n = len(history)
+    if n == 0:
+        return _missing_forecast(history, horizon)
+    weights = alpha * (1 - alpha) ** np.arange(n - 1, -1, -1)
+    weights[0] = (1 - alpha) ** (n - 1)
+    level = weights @ history
+    return np.repeat(level[np.newaxis], horizon, axis=0)
+
+
+BASELINES = {
+    'seasonal_naive': seasonal_naive,
+    'moving_average': moving_average,
+    'climatology': climatology,
+    'exponential_smoothing': exponential_smoothing,
+}
+
+
+def baseline_forecasts(values, months, start, horizon=SEASON_LENGTH, baselines=None):
+    """
+    Forecast semua baseline mulai bulan `start` dari histori sebelum `start`.
+
+    Args:
+        values: array (n_months, n_tiles) histori bulan x tile
+        months: DatetimeIndex bulan histori (urutan baris values)
+
+    Returns:
+        (forecast_months, dict nama -> array (horizon, n_tiles))
+    """
+    baselines = BASELINES if baselines is None else baselines
+    start = pd.Timestamp(start)
+    history = values[np.asarray(months < start)]
+    forecast_months = pd.date_range(start, periods=horizon, freq='MS')
+    return forecast_months, {
+        name: forecaster(history, horizon) for name, forecaster in baselines.items()
+    }
@@ -0,0 +1,132 @@
+# Store padat titik panas harian: array hari x tile (uint16) yang disimpan sebagai
+# .npy dan dibaca dengan memory-map, plus metadata JSON (tanggal awal, tile id).
+# Tampilan mingguan/bulanan dihitung dengan resampling array (np.add.reduceat
+# pada batas periode), tanpa groupby DataFrame. Dibangun dari data titik mentah:
+#   python point_ingest.py fire_archive.csv --daily daily_hotspot_counts.npy
+import json
+import os
+
+import pandas as pd
+import numpy as np
+
+from data_pipeline import tile_columns
+
+DAILY_STORE_FILE = 'daily_hotspot_counts.npy'
+STORE_DTYPE = np.uint16
+
+# Frekuensi resampling yang didukung (alias pandas)
+FREQUENCIES = {'D': 'Harian', 'W': 'Mingguan', 'M': 'Bulanan'}
+
+
+def _metadata_path(path):
+    return f'{path}.json'
+
+
+def store_signature(path=DAILY_STORE_FILE):
+    """Tanda tangan (path, mtime, ukuran) store harian, untuk key st.cache_data"""
+    if not os.path.exists(path):
+        return (path, None, None)
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+class DailyHotspotStore:
+    """
+    Array padat jumlah titik panas hari x tile mulai tanggal `start`.
+
+    Query rentang tanggal adalah slice baris; resampling ke minggu/bulan
+    memakai np.add.reduceat pada posisi awal tiap periode.
+    """
+
+    def __init__(self, counts, start, tile_ids):
+        self.counts = counts
+        self.start = pd.Timestamp(start).normalize()
+        self.tile_ids = np.asarray(tile_ids)
+        self.days = pd.date_range(self.start, periods=len(counts), freq='D')
+
+    @classmethod
+    def from_counts(cls, counts, start, tile_ids):
+        """Bangun store dari array hitungan (dicek muat di STORE_DTYPE)"""
+        counts = np.asarray(counts)
+        limit = np.iinfo(STORE_DTYPE).max
+        if counts.size and counts.max() > limit:
+            raise ValueError(f"Jumlah titik panas per tile per hari melebihi {limit}")
+        return cls(counts.astype(STORE_DTYPE), start, tile_ids)
+
+    @classmethod
+    def load(cls, path=DAILY_STORE_FILE):
+        """Baca store dengan memory-map (None jika file tidak ada)"""
+        if not os.path.exists(path) or not os.path.exists(_metadata_path(path)):
+            return None
+        with open(_metadata_path(path)) as f:
+            meta = json.load(f)
+        return cls(np.load(path, mmap_mode='r'), meta['start'], meta['tile_ids'])
+
+    def save(self, path=DAILY_STORE_FILE):
+        """Simpan array (.npy) dan metadata (.json) secara atomik"""
+        tmp_path = f'{path}.{os.getpid()}.tmp.npy'
+        np.save(tmp_path, np.ascontiguousarray(self.counts, dtype=STORE_DTYPE))
+        os.replace(tmp_path, path)
+        meta_tmp = f'{_metadata_path(path)}.{os.getpid()}.tmp'
+        with open(meta_tmp, 'w') as f:
+            json.dump({'start': self.start.strftime('%Y-%m-%d'),
+                       'tile_ids': [int(t) for t in self.tile_ids]}, f)
+        os.replace(meta_tmp, _metadata_path(path))
+
+    def __len__(self):
+        return len(self.counts)
+
+    @property
+    def end(self):
+        return self.days[-1] if len(self.days) else self.start
+
+    def day_slice(self, start, end):
+        """Slice baris untuk rentang tanggal inklusif [start, end]"""
+        lo = np.searchsorted(self.days.values, np.datetime64(pd.Timestamp(start).normalize()), side='left')
+        hi = np.searchsorted(self.days.values, np.datetime64(pd.Timestamp(end).normalize()), side='right')
+        return slice(lo, hi)
+
+    def tile_positions(self, tile_ids=None):
+        """Posisi kolom untuk daftar tile id (None berarti semua tile)"""
+        if tile_ids is None:
+            return np.arange(len(self.tile_ids))
+        return np.flatnonzero(np.isin(self.tile_ids, list(tile_ids)))
+
+    def resample(self, freq='M', start=None, end=None, tile_ids=None):
+        """
+        Jumlah titik panas per periode x tile.
+
+        Args:
+            freq: 'D' (harian), 'W' (minggu, mulai Senin) atau 'M' (bulan)
+
+        Returns:
+            (periods, values): DatetimeIndex awal periode dan array (n_periods, n_tiles)
+        """
+        window = self.day_slice(start or self.start, end or self.end)
+        days = self.days[window]
+        values = np.asarray(self.counts[window][:, self.tile_positions(tile_ids)], dtype=np.int64)
+        if len(days) == 0 or freq == 'D':
+            return days, values
+
+        if freq == 'W':
+            period_start = days - pd.to_timedelta(days.dayofweek, unit='D')
+        elif freq == 'M':
+            period_start = days.to_period('M').to_timestamp()
+        else:
+            raise ValueError(f"Frekuensi tidak didukung: {freq}")
+
+        # Posisi hari pertama setiap periode (days terurut, jadi periode kontigu)
+        boundaries = np.flatnonzero(np.r_[True, period_start[1:] != period_start[:-1]])
+        return pd.DatetimeIndex(period_start[boundaries]), np.add.reduceat(values, boundaries, axis=0)
+
+    def series(self, freq='M', start=None, end=None, tile_ids=None):
+        """Total semua tile terpilih per periode sebagai Series"""
+        periods, values = self.resample(freq, start, end, tile_ids)
+        return pd.Series(values.sum(axis=1), index=periods, name='titik_panas')
+
+    def to_monthly_frame(self):
+        """Hasil bulanan dalam format wide monthly_hotspot_sum.csv"""
+        months, values = self.resample('M')
+        frame = pd.DataFrame(values, columns=tile_columns(self.tile_ids))
+        frame.insert(0, 'year_month', months.strftime('%Y-%m'))
+        return frame
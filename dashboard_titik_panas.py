@@ -6,6 +6,24 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from backtest import history_matrix, load_backtest
+from baselines import baseline_forecasts
+from daily_store import FREQUENCIES, DailyHotspotStore, store_signature
+from data_cube import HotspotCube
+from data_pipeline import REGION_NAMES, RISK_LEVELS, SOURCE_FILES, TILE_LOCATION_MAP
+from dataset_cache import load_dataset, load_quartiles, load_validation, source_signature
+from detail_table import DETAIL_COLUMNS, DetailTable
+from frame_index import FrameIndex
+from forecast_registry import PRIMARY_MODEL, build_registry, discover_forecast_files, forecast_signature
+from kpi_engine import KpiEngine
+from metric_engine import MetricEngine
+from region_rollup import RegionRollup
+from view_cache import ViewCache, normalize_filters
+from table_styles import highlight_matrix, style_table
+from tile_geometry import TileIndex
+from tile_map import RISK_COLORS, TileMapLayer
+from weather_synthesis import DEFAULT_SEED
+
 def calculate_mape(y_true, y_pred):
     """Calculate Mean Absolute Percentage Error (MAPE)"""
     y_true, y_pred = np.array(y_true), np.array(y_pred)
@@ -20,266 +38,114 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Mapping tile ID to location names
-TILE_LOCATION_MAP = {
-    1: "Blok SK 1", 2: "Blok SK 2", 3: "Blok SK 3",
-    4: "Blok SK 4", 5: "Blok SK 5",
-    6: "Blok TP 1", 7: "Blok TP 2", 8: "Blok TP 3",
-    9: "Blok TP 4", 10: "Blok TP 5",
-    11: "Blok SR 1", 12: "Blok SR 2", 13: "Blok SR 3",
-    14: "Blok SR 4", 15: "Blok SR 5",
-    16: "Blok BA 1", 17: "Blok BA 2", 18: "Blok BA 3",
-    19: "Blok BA 4", 20: "Blok BA 5",
-    21: "Blok KB 1", 22: "Blok KB 2", 23: "Blok KB 3",
-    24: "Blok KB 4", 25: "Blok KB 5"
-}
+# Indeks geometri tile (dibangun sekali per proses)
+@st.cache_resource
+def load_tile_index():
+    """Load indeks geometri tile dari pontianak_tile_boundaries.csv"""
+    return TileIndex.from_csv('pontianak_tile_boundaries.csv')
+
+# Layer poligon tile untuk peta (GeoJSON dibangun sekali per proses)
+@st.cache_resource
+def load_tile_map():
+    """Layer choropleth tile dari empat sudut di pontianak_tile_boundaries.csv"""
+    tile_index = load_tile_index()
+    areas = [TILE_LOCATION_MAP.get(t, f"Tile {t}") for t in tile_index.ids]
+    return TileMapLayer(tile_index, areas)
 
 # Fungsi untuk load data real
 @st.cache_data
-def load_real_data():
-    """Load real data dari CSV files"""
-    # Load historical data
-    historical_df = pd.read_csv('monthly_hotspot_sum.csv')
-    
-    # Load forecast data
-    # forecast_df = pd.read_csv('monthly_hotspot_forecasts_2025.csv')
-    # forecast_df = pd.read_csv('better_LSTM_monthly_hotspot_forecasts_2025.csv')
-    # forecast_df = pd.read_csv('improved_monthly_hotspot_forecasts_2025.csv')
-    forecast_df = pd.read_csv('monthly_hotspot_forecasts_2025_new.csv')
-    
-    # Load categorical forecast data
-    categorical_df = pd.read_csv('categorical_forecasts_2025.csv')
-    
-    # Load tile boundaries
-    tiles_df = pd.read_csv('pontianak_tile_boundaries.csv')
-    
-    # Load real weather data from Kuburaya
-    weather_df = pd.read_csv('Kuburaya Dalam angka 2014-2024.csv')
-    
-    # Clean weather data
-    weather_df['Time'] = pd.to_datetime(weather_df['Time'])
-    weather_df = weather_df.rename(columns={
-        'Time': 'year_month',
-        'penyinaran matahari': 'solar_radiation_raw',
-        'avg kecepatan angin(knot)': 'wind_speed_knot',
-        'arah angin terbanyak': 'wind_direction_raw',
-        'curah hujan(mm)': 'rainfall_raw'
-    })
-    
-    # Convert knots to m/s (1 knot = 0.514444 m/s)
-    weather_df['wind_speed_ms'] = pd.to_numeric(weather_df['wind_speed_knot'], errors='coerce') * 0.514444
-    
-    # Clean rainfall data (remove commas and convert)
-    weather_df['rainfall'] = weather_df['rainfall_raw'].astype(str).str.replace(',', '.').apply(pd.to_numeric, errors='coerce')
-    
-    # Clean solar radiation data
-    weather_df['solar_radiation'] = pd.to_numeric(weather_df['solar_radiation_raw'], errors='coerce')
-    
-    # Convert solar radiation percentage to W/m² (approximate conversion)
-    # Assuming max solar radiation ~1000 W/m² at 100%
-    weather_df['solar_radiation_wm2'] = weather_df['solar_radiation'] * 10
-    
-    # Create weather lookup dict
-    weather_lookup = {}
-    for _, row in weather_df.iterrows():
-        if pd.notna(row['year_month']):
-            weather_lookup[row['year_month'].strftime('%Y-%m')] = {
-                'rainfall': row['rainfall'] if pd.notna(row['rainfall']) else None,
-                'solar_radiation': row['solar_radiation_wm2'] if pd.notna(row['solar_radiation_wm2']) else None,
-                'wind_speed': row['wind_speed_ms'] if pd.notna(row['wind_speed_ms']) else None
-            }
-    
-    # Create categorical risk lookup for 2025
-    categorical_lookup = {}
-    for _, row in categorical_df.iterrows():
-        year_month_key = pd.to_datetime(row['year_month']).strftime('%Y-%m')
-        categorical_lookup[year_month_key] = {}
-        for tile_num in range(1, 26):
-            tile_col = f'tile_{tile_num}'
-            risk_category = row[tile_col]
-            # Map English to Indonesian
-            if risk_category == 'High':
-                risk_level = 'Tinggi'
-            elif risk_category == 'Medium':
-                risk_level = 'Sedang'
-            elif risk_category == 'Low':
-                risk_level = 'Rendah'
-            else:
-                risk_level = 'Rendah'
-            categorical_lookup[year_month_key][tile_num] = risk_level
-    
-    # Mark data sources before combining
-    historical_df['sumber_data'] = 'Realisasi'
-    forecast_df['sumber_data'] = 'Prakiran'
-    
-    # Combine historical/actual and forecast data
-    combined_df = pd.concat([historical_df, forecast_df], ignore_index=True)
-    
-    # Convert to long format
-    data_list = []
-    for _, row in combined_df.iterrows():
-        sumber = row.get('sumber_data', 'Realisasi')
-        year_month = row['year_month']
-        date = pd.to_datetime(year_month)
-        year_month_key = date.strftime('%Y-%m')
-        
-        # Get month for season determination
-        month = date.month
-        is_dry_season = month in [4, 5, 6, 7, 8, 9, 10]
-        
-        # Get real weather data if available
-        real_weather = weather_lookup.get(year_month_key, {})
-        
-        for tile_num in range(1, 26):  # 25 tiles
-            tile_col = f'tile_{tile_num}'
-            hotspot_count = row[tile_col]
-            
-            # Get tile info
-            tile_info = tiles_df[tiles_df['id'] == tile_num].iloc[0]
-            lat = (tile_info['lat_top_left'] + tile_info['lat_bottom_left']) / 2
-            lon = (tile_info['lon_top_left'] + tile_info['lon_bottom_left']) / 2
-            
-            # Use location name mapping
-            area_name = TILE_LOCATION_MAP.get(tile_num, f"Tile {tile_num}")
-            
-            # Use real weather data if available, otherwise simulate
-            if real_weather.get('rainfall') is not None:
-                # Use real data
-                rainfall = real_weather['rainfall']
-                solar_radiation = real_weather.get('solar_radiation')
-                if solar_radiation is None:
-                    solar_radiation = 450 if is_dry_season else 350
-                    
-                wind_speed = real_weather.get('wind_speed')
-                if wind_speed is None:
-                    wind_speed = 3.5 if is_dry_season else 2.8
-                
-                # Estimate temperature based on rainfall and season
-                if is_dry_season:
-                    temperature = 28 - (rainfall / 100) + np.random.normal(0, 0.5)
-                else:
-                    temperature = 27 - (rainfall / 150) + np.random.normal(0, 0.5)
-                
-                # Estimate humidity based on rainfall
-                humidity = min(95, max(60, 75 + (rainfall / 20) + np.random.normal(0, 3)))
-                
-                # Wind direction based on season (real data often shows T/A - not available)
-                if is_dry_season:
-                    wind_direction = 120 + np.random.normal(0, 30)  # Southeast
-                else:
-                    wind_direction = 240 + np.random.normal(0, 30)  # Southwest
-            else:
-                # Simulate for 2025 or missing data
-                if is_dry_season:
-                    rainfall = max(0, 120 - hotspot_count * 10 + np.random.normal(0, 30))
-                    temperature = 28 + hotspot_count * 0.1 + np.random.normal(0, 1)
-                    humidity = max(60, 75 - hotspot_count * 0.5 + np.random.normal(0, 5))
-                    solar_radiation = 450 + np.random.normal(0, 40)
-                    wind_speed = 3.5 + np.random.normal(0, 1)
-                    wind_direction = 120 + np.random.normal(0, 30)
-                else:
-                    rainfall = max(0, 280 - hotspot_count * 5 + np.random.normal(0, 50))
-                    temperature = 27 + hotspot_count * 0.05 + np.random.normal(0, 1)
-                    humidity = max(70, 85 - hotspot_count * 0.3 + np.random.normal(0, 5))
-                    solar_radiation = 350 + np.random.normal(0, 40)
-                    wind_speed = 2.8 + np.random.normal(0, 1)
-                    wind_direction = 240 + np.random.normal(0, 30)
-            
-            wind_direction = wind_direction % 360
-            
-            # Ensure all values are numeric (not None)
-            rainfall = rainfall if rainfall is not None else 0
-            solar_radiation = solar_radiation if solar_radiation is not None else (450 if is_dry_season else 350)
-            wind_speed = wind_speed if wind_speed is not None else (3.5 if is_dry_season else 2.8)
-            temperature = temperature if temperature is not None else (28 if is_dry_season else 27)
-            humidity = humidity if humidity is not None else (75 if is_dry_season else 85)
-            
-            # FFMC calculation
-            ffmc = max(20, min(95, 60 + (hotspot_count * 2) - (rainfall * 0.1)))
-            
-            # Check if this is 2025 forecast data with categorical risk
-            year = date.year
-            if year == 2025 and year_month_key in categorical_lookup:
-                # Use categorical risk from CSV
-                risk_level = categorical_lookup[year_month_key].get(tile_num, 'Rendah')
-                # Assign risk score based on categorical level
-                if risk_level == 'Tinggi':
-                    risk_score = 60  # High risk score
-                elif risk_level == 'Sedang':
-                    risk_score = 40  # Medium risk score
-                else:
-                    risk_score = 20  # Low risk score
-            else:
-                # Calculate risk for historical data
-                risk_score = (
-                    hotspot_count * 5 + 
-                    max(0, (100 - rainfall/3)) * 0.25 +
-                    max(0, (temperature - 26)) * 0.15 +
-                    max(0, (ffmc - 40)) * 0.15 +
-                    max(0, (wind_speed - 2)) * 0.10
-                )
-                
-                if risk_score > 70:
-                    risk_level = "Sangat Tinggi"
-                elif risk_score > 50:
-                    risk_level = "Tinggi"
-                elif risk_score > 30:
-                    risk_level = "Sedang"
-                else:
-                    risk_level = "Rendah"
-            
-            # ISPU calculation
-            ispu = max(0, int(45 + (hotspot_count * 3) + np.random.normal(0, 10)))
-            
-            data_list.append({
-                'tanggal': date,
-                'area': area_name,
-                'tile_id': tile_num,
-                'latitude': lat,
-                'longitude': lon,
-                'titik_panas': hotspot_count,
-                'curah_hujan': rainfall,
-                'sinaran_matahari': solar_radiation,
-                'kecepatan_angin': wind_speed,
-                'arah_angin': wind_direction,
-                'suhu': temperature,
-                'kelembaban': humidity,
-                'ffmc': ffmc,
-                'ispu': ispu,
-                'tingkat_risiko': risk_level,
-                'skor_risiko': risk_score,
-                'musim': 'Kemarau' if is_dry_season else 'Hujan',
-                'sumber_data': sumber
-            })
-    
-    return pd.DataFrame(data_list)
+def load_real_data(signature, seed=DEFAULT_SEED):
+    """Load real data dari cache Arrow on-disk (diperbarui inkremental jika file sumber berubah)"""
+    return load_dataset(seed=seed)
+
+@st.cache_resource
+def load_forecast_registry(signature, model_files, seed=DEFAULT_SEED):
+    """Registry model forecast (file model baru dibaca saat dipilih)"""
+    return build_registry(model_files, load_real_data(signature, seed))
+
+@st.cache_resource
+def load_model_data(signature, model_files, model, seed=DEFAULT_SEED):
+    """Dataset dengan baris Prakiran (dan kolom turunannya) dari model forecast terpilih"""
+    registry = load_forecast_registry(signature, model_files, seed)
+    quartiles = load_quartiles(registry.tile_ids, seed=seed)
+    return registry.with_model(load_real_data(signature, seed), model, quartiles, seed)
+
+@st.cache_resource
+def load_hotspot_cube(signature, model_files, model, seed=DEFAULT_SEED):
+    """Cube padat sumber x tile x bulan untuk filter sidebar (dibangun sekali per data dan model)"""
+    return HotspotCube(load_model_data(signature, model_files, model, seed))
+
+@st.cache_resource
+def load_kpi_engine(signature, model_files, model, seed=DEFAULT_SEED):
+    """KPI engine (memoized per filter) di atas cube data"""
+    return KpiEngine(load_hotspot_cube(signature, model_files, model, seed))
+
+@st.cache_resource
+def load_metric_engine(signature, model_files, seed=DEFAULT_SEED):
+    """Metric engine data aktual 2025 (hasil per model di-cache berdasarkan hash forecast)"""
+    registry = load_forecast_registry(signature, model_files, seed)
+    months_2025 = registry.months[registry.months.year == 2025]
+    quartiles = load_quartiles(registry.tile_ids, seed=seed)
+    return MetricEngine.from_validation(
+        load_validation(seed=seed), registry.tile_ids, months_2025, quartiles
+    )
+
+@st.cache_data
+def load_baseline_models(signature, model_files, seed=DEFAULT_SEED):
+    """Forecast baseline 2025 (dari histori sebelum 2025) pada indeks tile x bulan metric engine"""
+    engine = load_metric_engine(signature, model_files, seed)
+    months, values = history_matrix(pd.read_csv(SOURCE_FILES['historical']), engine.tile_ids)
+    forecast_months, forecasts = baseline_forecasts(values, months, engine.months[0])
+    month_pos = forecast_months.get_indexer(engine.months)
+    return {
+        f'baseline: {name}': np.where(month_pos >= 0, forecast[month_pos].T, np.nan)
+        for name, forecast in forecasts.items()
+    }
+
+@st.cache_resource
+def load_region_rollup(signature, model_files, model, seed=DEFAULT_SEED):
+    """Rollup blok kecamatan x bulan di atas cube data"""
+    return RegionRollup(load_hotspot_cube(signature, model_files, model, seed), load_tile_index())
+
+@st.cache_resource
+def load_frame_index(signature, model_files, model, seed=DEFAULT_SEED):
+    """Indeks baris (offset bulan x sumber) untuk filter tanpa mask/salinan"""
+    return FrameIndex(load_model_data(signature, model_files, model, seed))
+
+@st.cache_resource
+def load_detail_table(signature, model_files, model, seed=DEFAULT_SEED):
+    """Tabel rinci tile x bulan (sort/filter/paginasi di server)"""
+    return DetailTable(load_model_data(signature, model_files, model, seed))
+
+@st.cache_resource
+def load_daily_store(signature):
+    """Store harian tile x hari (memory-map), None jika belum dibuat oleh point_ingest.py"""
+    return DailyHotspotStore.load()
+
+@st.cache_resource
+def get_view_cache():
+    """Cache LRU view per filter, dipakai bersama oleh semua sesi"""
+    return ViewCache()
+
+@st.cache_data
+def load_backtest_results(signature):
+    """Hasil backtest rolling-origin atas histori (cache on-disk di .cache/backtest)"""
+    # Tanpa process pool di server; prebuild paralel lewat: python backtest.py
+    return load_backtest(max_workers=1)
+
+@st.cache_data
+def load_forecast_files(signature):
+    """Daftar model forecast (isi file hanya di-hash ulang jika path/mtime/ukuran berubah)"""
+    return discover_forecast_files(signature)
 
 @st.cache_data
-def load_validation_data():
+def load_validation_data(signature):
     """Load data realisasi/aktual tahun 2025 untuk validasi"""
-    try:
-        # Membaca file CSV data asli 2025
-        val_df = pd.read_csv('real_monthly_hotspot_sum2025.csv')
-        
-        # Mengubah format data dari lebar (wide) ke panjang (long) agar cocok dengan data forecast
-        val_melted = val_df.melt(
-            id_vars=['year_month'], 
-            var_name='tile_str', 
-            value_name='titik_panas_aktual'
-        )
-        
-        # Membersihkan kolom tile_id (mengubah 'tile_1' menjadi angka 1)
-        val_melted['tile_id'] = val_melted['tile_str'].str.replace('tile_', '').astype(int)
-        
-        # Mengubah format tanggal
-        val_melted['tanggal'] = pd.to_datetime(val_melted['year_month'])
-        
-        return val_melted[['tanggal', 'tile_id', 'titik_panas_aktual']]
-    except FileNotFoundError:
-        return None
+    return load_validation()
 
-# Load real data
-df = load_real_data()
+# Load real data (signature file sumber sebagai key cache agar data bulan baru langsung terbaca)
+data_signature = source_signature()
+model_files = load_forecast_files(forecast_signature())
 
 # Page Navigation
 st.sidebar.title("Navigasi")
@@ -292,6 +158,18 @@ st.sidebar.markdown("---")
 # Filter Panel
 st.sidebar.subheader("Panel Filter")
 
+# Model forecast: mengganti model membangun ulang baris Prakiran dari nilai model
+model_names = [name for name, *_ in model_files] or [PRIMARY_MODEL]
+selected_model = st.sidebar.selectbox(
+    "Model Prakiran:",
+    model_names,
+    index=model_names.index(PRIMARY_MODEL) if PRIMARY_MODEL in model_names else 0
+)
+# Indeks baris dibagikan antar sesi; opsi sidebar diambil darinya tanpa menyalin dataset
+frame_index = load_frame_index(data_signature, model_files, selected_model)
+# Key data untuk cache view: file sumber + model forecast
+data_key = (data_signature, model_files, selected_model)
+
 st.sidebar.info("""
     **Legenda Kode Blok:**
     - **SK** = Sungai Kakap
@@ -319,7 +197,7 @@ st.sidebar.markdown("""
 """, unsafe_allow_html=True)
 
 st.sidebar.markdown("**Filter Area/Lokasi**")
-all_areas = sorted(df['area'].unique())
+all_areas = sorted(set(frame_index.tile_areas))
 selected_areas = st.sidebar.multiselect(
     "Pilih Lokasi:",
     options=all_areas,
@@ -329,7 +207,7 @@ selected_areas = st.sidebar.multiselect(
 # Date range filter - Month based
 st.sidebar.markdown("**Rentang Waktu**")
 # Filter to show only 2020 onwards for more relevant data
-years = sorted([y for y in df['tanggal'].dt.year.unique() if y >= 2020])
+years = sorted([y for y in pd.DatetimeIndex(frame_index.months).year.unique() if y >= 2020])
 months = list(range(1, 13))
 month_names = ['Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
                'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember']
@@ -348,27 +226,123 @@ with col2:
     end_month = st.selectbox("Bulan Akhir:", months, format_func=lambda x: month_names[x-1], index=11)
 
 # Apply filters
-filtered_df = df.copy()
-
-# Filter by areas
-if selected_areas:
-    filtered_df = filtered_df[filtered_df['area'].isin(selected_areas)]
-
-# Filter by date range
 start_date = pd.Timestamp(year=start_year, month=start_month, day=1)
 end_date = pd.Timestamp(year=end_year, month=end_month, day=1) + pd.offsets.MonthEnd(0)
-filtered_df = filtered_df[(filtered_df['tanggal'] >= start_date) & (filtered_df['tanggal'] <= end_date)]
 
-# Calculate YoY metrics for comparison
-prev_year_start = start_date - pd.DateOffset(years=1)
-prev_year_end = end_date - pd.DateOffset(years=1)
-prev_year_df = df[(df['tanggal'] >= prev_year_start) & (df['tanggal'] <= prev_year_end)]
-if selected_areas:
-    prev_year_df = prev_year_df[prev_year_df['area'].isin(selected_areas)]
+# View yang bergantung pada filter di-cache (LRU, dibatasi memori) dengan key
+# tuple filter ternormalisasi. View yang tidak bergantung pada halaman memakai
+# key tanpa halaman agar bisa dipakai bersama oleh kedua halaman.
+view_cache = get_view_cache()
+filter_key = normalize_filters(selected_areas, start_date, end_date, page)
+range_key = (data_key,) + filter_key[:3]
+
+def compute_filtered_view():
+    """Slice data sesuai filter area dan rentang tanggal"""
+    # Rentang tanggal = slice kontigu; area/sumber = take posisi baris (tanpa mask penuh)
+    filtered = frame_index.view(start_date, end_date, selected_areas)
+
+    # Data forecast pada rentang filter (untuk peta dan halaman detail)
+    return filtered, frame_index.view(start_date, end_date, selected_areas, source='Prakiran')
+
+filtered_df, forecast_df = view_cache.get_or_compute(('filtered',) + range_key, compute_filtered_view)
+
+def compute_evaluation_view(engine, registry, baseline_models):
+    """Skor semua model forecast 2025 terhadap data aktual sekaligus (None jika kosong)"""
+    # Subset tile sesuai area yang dipilih di sidebar
+    tiles = None
+    if selected_areas:
+        tiles = [t for t, area in TILE_LOCATION_MAP.items() if area in selected_areas]
+    
+    # Semua model pada indeks tile x bulan engine (model terpilih lebih dulu)
+    month_pos = registry.months.get_indexer(engine.months)
+    names = [selected_model] + [n for n in registry.names() if n != selected_model]
+    models = {name: registry.filled_values(name)[month_pos].T for name in names}
+    models.update(baseline_models)
+    results = engine.evaluate(models, tiles)
+    
+    result = results[selected_model]
+    has_data = result['month_has_data']
+    if not has_data.any():
+        return None
+    
+    # Metrik error (Safe MAPE: pembagi minimal 1 karena data titik panas sering 0)
+    mae = float(result['overall']['mae'])
+    mape = float(result['overall']['mape'])
+    
+    # Hitung Akurasi (100% - MAPE)
+    accuracy = max(0, 100 - mape)
+    
+    # Agregasi per bulan untuk grafik garis
+    monthly_eval = pd.DataFrame({
+        'tanggal': engine.months[has_data],
+        'titik_panas': result['monthly_pred'][has_data],
+        'titik_panas_aktual': result['monthly_actual'][has_data]
+    })
+    
+    # Hitung error per bulan
+    monthly_eval['Selisih (Diff)'] = monthly_eval['titik_panas'] - monthly_eval['titik_panas_aktual']
+    monthly_eval['MAPE Bulanan (%)'] = (
+        np.abs(monthly_eval['Selisih (Diff)']) / 
+        np.maximum(monthly_eval['titik_panas_aktual'], 1) * 100
+    ).round(2)
+    
+    # Format tampilan tabel
+    display_table = monthly_eval.rename(columns={
+        'tanggal': 'Bulan',
+        'titik_panas': 'Prediksi',
+        'titik_panas_aktual': 'Aktual'
+    })
+    
+    display_table['Bulan'] = display_table['Bulan'].dt.strftime('%B %Y')
+    
+    # Perbandingan semua model dan baseline (urut MAPE terkecil)
+    leaderboard = engine.leaderboard(models, tiles).round(2).reset_index().rename(columns={
+        'model': 'Model',
+        'mape': 'MAPE (%)',
+        'mae': 'MAE',
+        'rmse': 'RMSE',
+        'bias': 'Bias',
+        'hit_rate': 'Ketepatan Kategori (%)'
+    })
+    
+    return {'mae': mae, 'mape': mape, 'accuracy': accuracy, 'display_table': display_table,
+            'leaderboard': leaderboard}
 
-# Separate historical/actual and forecast data based on source
-historical_df = filtered_df[filtered_df['sumber_data'] == 'Realisasi']
-forecast_df = filtered_df[filtered_df['sumber_data'] == 'Prakiran']
+def compute_detail_view():
+    """Ringkasan bulanan dan per lokasi untuk halaman Detail Data"""
+    # Monthly summary with risk categorization
+    monthly_summary = forecast_df.groupby('tanggal').agg({
+        'titik_panas': 'sum',
+        'curah_hujan': 'mean',
+        'tingkat_risiko': lambda x: x.mode()[0] if len(x) > 0 else 'Rendah'
+    }).reset_index()
+    
+    monthly_summary['Bulan'] = monthly_summary['tanggal'].dt.strftime('%B %Y')
+    monthly_summary['Titik Panas'] = monthly_summary['titik_panas'].round(0).astype(int)
+    monthly_summary['Curah Hujan (mm)'] = monthly_summary['curah_hujan'].round(1)
+    monthly_summary['Kategori Risiko'] = monthly_summary['tingkat_risiko']
+    
+    # Display table with styling
+    display_df = monthly_summary[['Bulan', 'Titik Panas', 'Curah Hujan (mm)', 'Kategori Risiko']].copy()
+    
+    area_summary = forecast_df.groupby('area', observed=True).agg({
+        'titik_panas': 'sum',
+        'tingkat_risiko': lambda x: x.mode()[0] if len(x) > 0 else 'Rendah'
+    }).reset_index()
+    
+    area_summary = area_summary.sort_values('titik_panas', ascending=False)
+    area_summary.columns = ['Lokasi', 'Total Prakiran Titik Panas (2025)', 'Kategori Risiko Dominan']
+    area_summary['Total Prakiran Titik Panas (2025)'] = area_summary['Total Prakiran Titik Panas (2025)'].round(0).astype(int)
+    
+    min_val = monthly_summary['Titik Panas'].min()
+    max_val = monthly_summary['Titik Panas'].max()
+    
+    return {
+        'monthly_summary': monthly_summary,
+        'display_df': display_df,
+        'display_styles': highlight_matrix(display_df, 'Titik Panas', 'Kategori Risiko', min_val, max_val),
+        'area_summary': area_summary
+    }
 
 # ============================================================================
 # PAGE: RINGKASAN EKSEKUTIF
@@ -391,10 +365,13 @@ if page == "📊 Ringkasan Eksekutif":
     # KPI Cards with YoY comparison
     col1, col2, col3 = st.columns(3)
 
+    # Semua seri KPI dan grafik dihitung sekali oleh KPI engine (memoized per filter)
+    kpi = load_kpi_engine(data_signature, model_files, selected_model).summary(selected_areas, start_date, end_date)
+
     with col1:
-        total_hotspots = filtered_df['titik_panas'].sum()
-        prev_total_hotspots = prev_year_df['titik_panas'].sum()
-        yoy_change = 0 if prev_total_hotspots == 0 else ((total_hotspots - prev_total_hotspots) / prev_total_hotspots) * 100
+        total_hotspots = kpi['total']
+        prev_total_hotspots = kpi['prev_total']
+        yoy_change = kpi['yoy_change']
         
         st.metric(
             label="Total Titik Panas",
@@ -403,9 +380,9 @@ if page == "📊 Ringkasan Eksekutif":
         )
 
     with col2:
-        avg_hotspots = filtered_df.groupby('tanggal')['titik_panas'].sum().mean()
-        prev_avg_hotspots = prev_year_df.groupby('tanggal')['titik_panas'].sum().mean()
-        yoy_avg_change = 0 if prev_avg_hotspots == 0 else ((avg_hotspots - prev_avg_hotspots) / prev_avg_hotspots) * 100
+        avg_hotspots = kpi['avg']
+        prev_avg_hotspots = kpi['prev_avg']
+        yoy_avg_change = kpi['yoy_avg_change']
         
         st.metric(
             label="Rata-rata Titik Panas per Bulan",
@@ -414,9 +391,8 @@ if page == "📊 Ringkasan Eksekutif":
         )
 
     with col3:
-        monthly_totals = filtered_df.groupby('tanggal')['titik_panas'].sum()
-        max_month = monthly_totals.idxmax()
-        max_month_value = monthly_totals.max()
+        max_month = kpi['peak_month']
+        max_month_value = kpi['peak_value']
         
         st.metric(
             label="Bulan Puncak Titik Panas",
@@ -430,15 +406,8 @@ if page == "📊 Ringkasan Eksekutif":
     st.subheader("Tren Titik Panas: Data Historis vs Prakiran")
     
     # Monthly aggregation
-    monthly_historical = historical_df.groupby('tanggal').agg({
-        'titik_panas': 'sum',
-        'curah_hujan': 'mean'
-    }).reset_index()
-    
-    monthly_forecast = forecast_df.groupby('tanggal').agg({
-        'titik_panas': 'sum',
-        'curah_hujan': 'mean'
-    }).reset_index()
+    monthly_historical = kpi['monthly_historical']
+    monthly_forecast = kpi['monthly_forecast']
     
     # Combined chart
     fig_combined = go.Figure()
@@ -492,6 +461,99 @@ if page == "📊 Ringkasan Eksekutif":
     - **Garis Oranye Putus-putus**: Prakiran model LSTM untuk periode mendatang
     - Pola musiman terlihat jelas dengan puncak pada bulan-bulan kemarau (Juli-Oktober)
     """)
+
+    # Tren sub-bulanan dari store harian (hanya jika daily_hotspot_counts.npy tersedia)
+    daily_signature = store_signature()
+    daily_store = load_daily_store(daily_signature)
+    if daily_store is not None:
+        st.subheader("Tren Titik Panas Harian/Mingguan")
+        granularity = st.radio(
+            "Granularitas:", list(FREQUENCIES), index=1, horizontal=True,
+            format_func=FREQUENCIES.get
+        )
+
+        def compute_daily_trend():
+            """Resampling store harian untuk tile pada area terpilih (kosong berarti semua tile)"""
+            tile_ids = None
+            if selected_areas:
+                tile_ids = [t for t in daily_store.tile_ids
+                            if TILE_LOCATION_MAP.get(t, f"Tile {t}") in selected_areas]
+            return daily_store.series(granularity, start_date, end_date, tile_ids)
+
+        daily_trend = view_cache.get_or_compute(
+            ('daily_trend', granularity, daily_signature) + range_key, compute_daily_trend
+        )
+        if len(daily_trend) > 0:
+            fig_daily = px.bar(
+                x=daily_trend.index, y=daily_trend.values,
+                labels={'x': 'Periode', 'y': 'Jumlah Titik Panas'},
+                title=f"Titik Panas {FREQUENCIES[granularity]} (Data Titik Satelit)",
+                color_discrete_sequence=['#1f77b4']
+            )
+            fig_daily.update_layout(height=400)
+            st.plotly_chart(fig_daily, use_container_width=True)
+        else:
+            st.info("Store harian tidak mencakup rentang waktu yang dipilih.")
+    
+    st.markdown("---")
+
+    # Drill-down per blok kecamatan (dibaca dari rollup blok x bulan)
+    st.subheader("Analisis per Kecamatan")
+    region_rollup = load_region_rollup(data_signature, model_files, selected_model)
+    region_summary = region_rollup.summary(start_date, end_date)
+    
+    fig_region = px.bar(
+        region_summary,
+        x='nama',
+        y='kepadatan_per_100km2',
+        hover_data=['titik_panas', 'area_km2'],
+        labels={'nama': 'Kecamatan', 'kepadatan_per_100km2': 'Titik Panas per 100 km²',
+                'titik_panas': 'Total Titik Panas', 'area_km2': 'Luas (km²)'},
+        color_discrete_sequence=['#ff7f0e']
+    )
+    fig_region.update_layout(height=350)
+    st.plotly_chart(fig_region, use_container_width=True)
+    st.caption("Total per kecamatan memakai data Realisasi; Prakiran hanya untuk bulan yang belum ada realisasinya.")
+    
+    selected_region = st.selectbox(
+        "Pilih Kecamatan:",
+        region_rollup.regions,
+        format_func=lambda code: f"{REGION_NAMES[code]} ({code})"
+    )
+    region_monthly = region_rollup.monthly(selected_region, start_date, end_date)
+    
+    col_region1, col_region2 = st.columns([2, 1])
+    with col_region1:
+        fig_region_trend = px.line(
+            region_monthly,
+            x='tanggal',
+            y='titik_panas',
+            color='sumber_data',
+            markers=True,
+            title=f"Titik Panas Bulanan - {REGION_NAMES[selected_region]}",
+            labels={'tanggal': 'Periode', 'titik_panas': 'Jumlah Titik Panas', 'sumber_data': 'Sumber'}
+        )
+        fig_region_trend.update_layout(height=400, hovermode='x unified')
+        st.plotly_chart(fig_region_trend, use_container_width=True)
+    with col_region2:
+        # Dari ringkasan blok (satu sumber per bulan), bukan jumlah baris Realisasi + Prakiran
+        risk_totals = region_summary.set_index('region').loc[selected_region, RISK_LEVELS]
+        fig_region_risk = px.bar(
+            x=risk_totals.index,
+            y=risk_totals.values,
+            color=risk_totals.index,
+            color_discrete_map=RISK_COLORS,
+            title="Sebaran Tingkat Risiko (tile x bulan)",
+            labels={'x': 'Tingkat Risiko', 'y': 'Jumlah'}
+        )
+        fig_region_risk.update_layout(height=400, showlegend=False)
+        st.plotly_chart(fig_region_risk, use_container_width=True)
+    
+    st.dataframe(
+        region_rollup.tiles(selected_region, start_date, end_date),
+        use_container_width=True,
+        hide_index=True
+    )
     
     st.markdown("---")
 
@@ -499,46 +561,25 @@ if page == "📊 Ringkasan Eksekutif":
     st.markdown("**Perbandingan Data Prakiraan (Forecast) vs Realisasi (Aktual)**")
     
     # 1. Load Data
-    validation_df = load_validation_data()
+    validation_df = load_validation_data(data_signature)
     
     if validation_df is None:
         st.error("File 'real_monthly_hotspot_sum2025.csv' tidak ditemukan. Mohon upload file tersebut.")
     else:
-        # Ambil data forecast (Prakiran) khusus tahun 2025 dari dataset utama
-        forecast_2025 = df[(df['tanggal'].dt.year == 2025) & (df['sumber_data'] == 'Prakiran')].copy()
-        
-        # Gabungkan (Merge) data Forecast dan Aktual berdasarkan Tanggal dan Lokasi
-        eval_df = pd.merge(
-            forecast_2025,
-            validation_df,
-            on=['tanggal', 'tile_id'],
-            how='inner',
-            suffixes=('_pred', '_act')
+        evaluation = view_cache.get_or_compute(
+            ('evaluation', data_key, filter_key[0]),
+            lambda: compute_evaluation_view(
+                load_metric_engine(data_signature, model_files),
+                load_forecast_registry(data_signature, model_files),
+                load_baseline_models(data_signature, model_files)
+            )
         )
         
-        # Filter berdasarkan area yang dipilih di sidebar
-        if selected_areas:
-            eval_df = eval_df[eval_df['area'].isin(selected_areas)]
-            
-        if len(eval_df) > 0:
-            # 2. Perhitungan Error (MAPE & MAE)
-            # Menangani pembagian dengan nol untuk MAPE:
-            # Kita gunakan pendekatan "Safe MAPE" dimana jika nilai aktual 0, dianggap 1 untuk pembagi
-            # agar tidak error infinity. Ini umum untuk data kejadian jarang (count data).
-            
-            y_true = eval_df['titik_panas_aktual']
-            y_pred = eval_df['titik_panas']
-            
-            # Hitung MAE (Mean Absolute Error) - Rata-rata selisih mutlak
-            mae = np.mean(np.abs(y_true - y_pred))
-            
-            # Hitung MAPE (Mean Absolute Percentage Error)
-            # Rumus: Rata-rata dari |(Aktual - Prediksi) / Max(Aktual, 1)| * 100
-            mape_per_point = np.abs((y_true - y_pred) / np.maximum(y_true, 1)) * 100
-            mape = np.mean(mape_per_point)
-            
-            # Hitung Akurasi (100% - MAPE)
-            accuracy = max(0, 100 - mape)
+        if evaluation is not None:
+            mape = evaluation['mape']
+            accuracy = evaluation['accuracy']
+            mae = evaluation['mae']
+            display_table = evaluation['display_table']
             
             # 3. Tampilkan KPI
             st.markdown("### 📊 Metrik Performa Model")
@@ -567,37 +608,20 @@ if page == "📊 Ringkasan Eksekutif":
                 
             st.markdown("---")
             
-            # Agregasi per bulan untuk grafik garis
-            monthly_eval = eval_df.groupby('tanggal').agg({
-                'titik_panas': 'sum',
-                'titik_panas_aktual': 'sum'
-            }).reset_index()
-            
             # 4. Tabel Detail Error per Bulan
             st.subheader("Rincian Error per Bulan")
             
-            # Hitung error per bulan
-            monthly_eval['Selisih (Diff)'] = monthly_eval['titik_panas'] - monthly_eval['titik_panas_aktual']
-            monthly_eval['MAPE Bulanan (%)'] = (
-                np.abs(monthly_eval['Selisih (Diff)']) / 
-                np.maximum(monthly_eval['titik_panas_aktual'], 1) * 100
-            ).round(2)
-            
-            # Format tampilan tabel
-            display_table = monthly_eval.rename(columns={
-                'tanggal': 'Bulan',
-                'titik_panas': 'Prediksi',
-                'titik_panas_aktual': 'Aktual'
-            })
-            
-            display_table['Bulan'] = display_table['Bulan'].dt.strftime('%B %Y')
-            
             # Styling tabel
             st.dataframe(
                 display_table.style.background_gradient(subset=['MAPE Bulanan (%)'], cmap='Reds'),
                 use_container_width=True
             )
             
+            # 5. Perbandingan model forecast
+            if len(evaluation['leaderboard']) > 1:
+                st.subheader("Perbandingan Model Forecast dan Baseline")
+                st.dataframe(evaluation['leaderboard'], use_container_width=True, hide_index=True)
+            
             st.info("""
             **Catatan Perhitungan MAPE:**
             Karena data titik panas sering bernilai 0 (nol), perhitungan MAPE menggunakan penyesuaian (Safe MAPE) 
@@ -608,59 +632,86 @@ if page == "📊 Ringkasan Eksekutif":
         else:
             st.warning("Data untuk tahun 2025 tidak ditemukan dalam rentang filter yang dipilih.")
 
+    # Stabilitas model dari backtest rolling-origin (seluruh histori, semua tile)
+    backtest_df = load_backtest_results(data_signature)
+    if len(backtest_df) > 0:
+        st.subheader("Stabilitas Model (Backtest Rolling-Origin)")
+        fig_backtest = px.line(
+            backtest_df,
+            x='origin',
+            y='mape',
+            color='model',
+            markers=True,
+            labels={'origin': 'Origin Forecast', 'mape': 'MAPE (%)', 'model': 'Model'}
+        )
+        fig_backtest.update_layout(height=350, hovermode='x unified')
+        st.plotly_chart(fig_backtest, use_container_width=True)
+        st.caption(
+            "Setiap titik: model dilatih dengan data sebelum origin lalu diuji pada "
+            "12 bulan berikutnya (data monthly_hotspot_sum.csv)."
+        )
+
     # Map visualization
     st.subheader("Peta Distribusi Spasial Titik Panas")
 
-    # Month selector for map
-    if len(forecast_df) > 0:
-        available_months_2025 = sorted(forecast_df['tanggal'].unique())
-        
-        col_map1, col_map2 = st.columns([3, 1])
-        with col_map2:
-            selected_map_month = st.selectbox(
-                "Pilih Bulan:",
-                options=available_months_2025,
-                format_func=lambda x: x.strftime('%B %Y'),
-                index=len(available_months_2025)-1
+    map_mode = st.radio(
+        "Mode Peta:",
+        ["Per Bulan", "Animasi"],
+        horizontal=True,
+        help="Animasi memutar semua bulan di browser tanpa memuat ulang halaman."
+    )
+    tile_map = load_tile_map()
+    map_source = forecast_df if len(forecast_df) > 0 else filtered_df
+    
+    if map_mode == "Animasi":
+        dry_only = st.checkbox("Hanya bulan musim kemarau (Kemarau)", value=False)
+        
+        def compute_map_animation():
+            """Satu figure animasi (frame per bulan) untuk seluruh rentang filter"""
+            source = map_source[map_source['musim'] == 'Kemarau'] if dry_only else map_source
+            return tile_map.animated_figure(
+                tile_map.month_matrix(source),
+                title="Sebaran Risiko Titik Panas",
+                frame_label=lambda month, season: f"{pd.Timestamp(month).strftime('%B %Y')} ({season})"
             )
         
-        map_data = forecast_df[forecast_df['tanggal'] == selected_map_month]
+        fig_map = view_cache.get_or_compute(
+            ('map_animation', dry_only) + range_key, compute_map_animation
+        )
     else:
-        latest_date = filtered_df['tanggal'].max()
-        map_data = filtered_df[filtered_df['tanggal'] == latest_date]
-        selected_map_month = latest_date
-    
-    # Create map with better zoom settings
-    fig_map = px.scatter_mapbox(
-        map_data,
-        lat='latitude',
-        lon='longitude',
-        size='titik_panas',
-        color='tingkat_risiko',
-        hover_name='area',
-        hover_data=['titik_panas', 'tingkat_risiko'],
-        color_discrete_map={
-            'Rendah': '#2ecc71',
-            'Sedang': '#f39c12', 
-            'Tinggi': '#e74c3c',
-            'Sangat Tinggi': '#c0392b'
-        },
-        title=f"Sebaran Risiko Titik Panas - {selected_map_month.strftime('%B %Y')}",
-        mapbox_style="open-street-map",
-        zoom=8.5,  # Adjusted for better view of entire region
-        center={"lat": -0.35, "lon": 109.2},
-        size_max=30
-    )
-    
-    fig_map.update_layout(
-        height=700,
-        mapbox=dict(
-            bearing=0,
-            pitch=0
+        # Month selector for map
+        if len(forecast_df) > 0:
+            available_months_2025 = sorted(forecast_df['tanggal'].unique())
+            
+            col_map1, col_map2 = st.columns([3, 1])
+            with col_map2:
+                selected_map_month = st.selectbox(
+                    "Pilih Bulan:",
+                    options=available_months_2025,
+                    format_func=lambda x: x.strftime('%B %Y'),
+                    index=len(available_months_2025)-1
+                )
+        else:
+            selected_map_month = filtered_df['tanggal'].max()
+        
+        map_key = normalize_filters(selected_areas, start_date, end_date, map_month=selected_map_month)
+        # Per bulan hanya array kompak nilai/kode warna tile yang dihitung dan di-cache
+        map_values = view_cache.get_or_compute(
+            ('map', data_key) + map_key[:3] + map_key[4:],
+            lambda: tile_map.month_values(map_source[map_source['tanggal'] == selected_map_month])
+        )
+        
+        # Poligon tile (GeoJSON dibangun sekali) diwarnai sesuai tingkat risiko
+        fig_map = tile_map.figure(
+            map_values,
+            title=f"Sebaran Risiko Titik Panas - {selected_map_month.strftime('%B %Y')}"
         )
-    )
     
     st.plotly_chart(fig_map, use_container_width=True)
+    st.caption(
+        "Garis tepi tebal menandai klaster titik panas: tile dengan titik panas "
+        "yang juga memiliki tile tetangga (grid 8 arah) dengan titik panas."
+    )
 
             
 
@@ -682,44 +733,12 @@ elif page == "📋 Detail Data":
             "dengan mempertimbangkan korelasi terhadap jumlah titik panas prakiran.\n\n"
             "• **Kategori Risiko**: Dihitung berdasarkan threshold dari metode Quartile pada skor risiko prakiran titik panas."
         )
-        # Monthly summary with risk categorization
-        monthly_summary = forecast_df.groupby('tanggal').agg({
-            'titik_panas': 'sum',
-            'curah_hujan': 'mean',
-            'tingkat_risiko': lambda x: x.mode()[0] if len(x) > 0 else 'Rendah'
-        }).reset_index()
-        
-        monthly_summary['Bulan'] = monthly_summary['tanggal'].dt.strftime('%B %Y')
-        monthly_summary['Titik Panas'] = monthly_summary['titik_panas'].round(0).astype(int)
-        monthly_summary['Curah Hujan (mm)'] = monthly_summary['curah_hujan'].round(1)
-        monthly_summary['Kategori Risiko'] = monthly_summary['tingkat_risiko']
+        detail = view_cache.get_or_compute(('detail',) + range_key, compute_detail_view)
+        monthly_summary = detail['monthly_summary']
+        display_df = detail['display_df']
         
-        # Get min and max values for conditional formatting
-        min_val = monthly_summary['Titik Panas'].min()
-        max_val = monthly_summary['Titik Panas'].max()
-        
-        # Display table with styling
-        display_df = monthly_summary[['Bulan', 'Titik Panas', 'Curah Hujan (mm)', 'Kategori Risiko']].copy()
-        
-        # Apply conditional formatting using Styler
-        def highlight_values(row):
-            styles = [''] * len(row)
-            if row['Titik Panas'] == min_val:
-                styles[1] = 'background-color: #d4edda; color: #155724; font-weight: bold'
-            elif row['Titik Panas'] == max_val:
-                styles[1] = 'background-color: #f8d7da; color: #721c24; font-weight: bold'
-            
-            # Color code risk category
-            if row['Kategori Risiko'] == 'Tinggi':
-                styles[3] = 'background-color: #f8d7da; color: #721c24; font-weight: bold'
-            elif row['Kategori Risiko'] == 'Sedang':
-                styles[3] = 'background-color: #fff3cd; color: #856404; font-weight: bold'
-            else:
-                styles[3] = 'background-color: #d4edda; color: #155724; font-weight: bold'
-            
-            return styles
-        
-        styled_df = display_df.style.apply(highlight_values, axis=1)
+        # Conditional formatting: matriks CSS sudah dihitung vektorisasi di compute_detail_view
+        styled_df = style_table(display_df, detail['display_styles'])
         
         st.dataframe(styled_df, use_container_width=True, height=500)
         
@@ -765,14 +784,7 @@ elif page == "📋 Detail Data":
         # Area-wise breakdown
         st.subheader("Breakdown per Lokasi")
         
-        area_summary = forecast_df.groupby('area').agg({
-            'titik_panas': 'sum',
-            'tingkat_risiko': lambda x: x.mode()[0] if len(x) > 0 else 'Rendah'
-        }).reset_index()
-        
-        area_summary = area_summary.sort_values('titik_panas', ascending=False)
-        area_summary.columns = ['Lokasi', 'Total Prakiran Titik Panas (2025)', 'Kategori Risiko Dominan']
-        area_summary['Total Prakiran Titik Panas (2025)'] = area_summary['Total Prakiran Titik Panas (2025)'].round(0).astype(int)
+        area_summary = detail['area_summary']
         
         st.dataframe(area_summary, use_container_width=True, height=400)
         
@@ -780,6 +792,73 @@ elif page == "📋 Detail Data":
     else:
         st.warning("Data prakiran 2025 tidak tersedia. Silakan sesuaikan filter rentang waktu.")
         st.info("Pilih tahun 2025 pada filter sidebar untuk melihat data prakiran.")
+    
+    st.markdown("---")
+    
+    # Data rinci tile x bulan: filter, sort dan paginasi dihitung di server,
+    # hanya halaman yang terlihat yang dikirim ke browser
+    st.subheader("Data Rinci per Tile dan Bulan")
+    detail_table = load_detail_table(data_signature, model_files, selected_model)
+    
+    col_f1, col_f2, col_f3 = st.columns(3)
+    with col_f1:
+        detail_sources = st.multiselect("Sumber Data:", ['Realisasi', 'Prakiran'], default=[])
+    with col_f2:
+        detail_levels = st.multiselect("Kategori Risiko:", RISK_LEVELS, default=[])
+    with col_f3:
+        detail_min_hotspots = st.number_input("Minimal Titik Panas:", min_value=0.0, value=0.0, step=1.0)
+    
+    col_s1, col_s2, col_s3, col_s4 = st.columns(4)
+    with col_s1:
+        detail_sort = st.selectbox(
+            "Urutkan Berdasarkan:",
+            list(DETAIL_COLUMNS),
+            format_func=lambda col: DETAIL_COLUMNS[col]
+        )
+    with col_s2:
+        detail_ascending = st.radio("Urutan:", ["Naik", "Turun"], horizontal=True) == "Naik"
+    with col_s3:
+        detail_page_size = st.selectbox("Baris per Halaman:", [25, 50, 100, 250], index=1)
+    with col_s4:
+        detail_page = st.number_input("Halaman:", min_value=1, value=1, step=1)
+    
+    detail_filters = {
+        'start': start_date,
+        'end': end_date,
+        'areas': selected_areas,
+        'sources': detail_sources,
+        'risk_levels': detail_levels,
+        'min_hotspots': detail_min_hotspots if detail_min_hotspots > 0 else None,
+    }
+    page_key = (
+        'detail_page', data_key, filter_key[:3], tuple(detail_sources), tuple(detail_levels),
+        detail_min_hotspots, detail_sort, detail_ascending, detail_page_size, int(detail_page)
+    )
+    page_df, total_rows, n_pages = view_cache.get_or_compute(
+        page_key,
+        lambda: detail_table.page(
+            detail_page, detail_page_size, detail_sort, detail_ascending, **detail_filters
+        )
+    )
+    
+    shown_page = min(int(detail_page), n_pages)
+    st.caption(f"Halaman {shown_page} dari {n_pages} • {total_rows:,} baris sesuai filter")
+    st.dataframe(
+        page_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Bulan': st.column_config.DateColumn('Bulan', format='MMM YYYY'),
+            'Titik Panas': st.column_config.NumberColumn('Titik Panas', format='%.2f'),
+            'Titik Panas Tetangga': st.column_config.NumberColumn('Titik Panas Tetangga', format='%.2f'),
+            'Curah Hujan (mm)': st.column_config.NumberColumn('Curah Hujan (mm)', format='%.1f'),
+            'Suhu (°C)': st.column_config.NumberColumn('Suhu (°C)', format='%.1f'),
+            'Kelembaban (%)': st.column_config.NumberColumn('Kelembaban (%)', format='%.1f'),
+            'FFMC': st.column_config.NumberColumn('FFMC', format='%.1f'),
+            'ISPU': st.column_config.NumberColumn('ISPU', format='%.0f'),
+            'Skor Risiko': st.column_config.NumberColumn('Skor Risiko', format='%.1f'),
+        }
+    )
 
 
 
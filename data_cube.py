@@ -0,0 +1,111 @@
+import pandas as pd
+import numpy as np
+
+from data_pipeline import RISK_LEVELS
+
+# Urutan sumber data pada sumbu pertama cube
+CUBE_SOURCES = ['Realisasi', 'Prakiran']
+
+
+class HotspotCube:
+    """
+    Cube padat sumber x tile x bulan yang dibangun sekali dari data long-format.
+
+    Filter sidebar (area + rentang bulan) menjadi slicing indeks pada array
+    NumPy lalu reduksi, tanpa menyalin dan memfilter ulang DataFrame penuh.
+    Sel yang tidak punya baris di data long-format ditandai lewat `present`.
+    """
+
+    def __init__(self, df):
+        self.months = np.sort(df['tanggal'].unique())
+        self.tile_ids = np.sort(df['tile_id'].unique())
+        self.sources = list(CUBE_SOURCES)
+
+        # Nama area per tile (urut sesuai tile_ids)
+        first_rows = df.drop_duplicates('tile_id').set_index('tile_id')
+        self.tile_areas = first_rows.loc[self.tile_ids, 'area'].astype(str).to_numpy()
+
+        # Kode kategori langsung (kolom kategorikal tidak perlu di-map per baris)
+        src_pos = pd.Categorical(df['sumber_data'], categories=self.sources).codes
+        tile_pos = np.searchsorted(self.tile_ids, df['tile_id'].to_numpy())
+        month_pos = np.searchsorted(self.months, df['tanggal'].to_numpy())
+
+        shape = (len(self.sources), len(self.tile_ids), len(self.months))
+        self.present = np.zeros(shape, dtype=bool)
+        self.hotspots = np.zeros(shape)
+        self.rainfall = np.zeros(shape)
+        self.risk_score = np.zeros(shape)
+        # Kode tingkat risiko (indeks RISK_LEVELS), -1 untuk sel tanpa data
+        self.risk_code = np.full(shape, -1, dtype=np.int8)
+
+        idx = (src_pos, tile_pos, month_pos)
+        self.present[idx] = True
+        self.hotspots[idx] = df['titik_panas'].to_numpy(dtype=float)
+        self.rainfall[idx] = df['curah_hujan'].to_numpy(dtype=float)
+        self.risk_score[idx] = df['skor_risiko'].to_numpy(dtype=float)
+        self.risk_code[idx] = pd.Categorical(df['tingkat_risiko'], categories=RISK_LEVELS).codes
+
+        for arr in (self.present, self.hotspots, self.rainfall, self.risk_score, self.risk_code):
+            arr.flags.writeable = False
+
+    def tile_positions(self, areas):
+        """Posisi tile untuk daftar nama area (kosong/None berarti semua tile)"""
+        if not areas:
+            return np.arange(len(self.tile_ids))
+        return np.flatnonzero(np.isin(self.tile_areas, list(areas)))
+
+    def month_slice(self, start, end):
+        """Slice bulan untuk rentang tanggal inklusif [start, end]"""
+        lo = np.searchsorted(self.months, np.datetime64(pd.Timestamp(start)), side='left')
+        hi = np.searchsorted(self.months, np.datetime64(pd.Timestamp(end)), side='right')
+        return slice(lo, hi)
+
+    def source_positions(self, source=None):
+        """Posisi sumber data (None berarti semua sumber)"""
+        if source is None:
+            return np.arange(len(self.sources))
+        return np.array([self.sources.index(source)])
+
+    def select(self, values, areas, start, end, source=None):
+        """
+        Ambil sub-array (sumber x tile x bulan) untuk filter tertentu.
+
+        Returns:
+            (values, present, months) hasil slicing
+        """
+        months = self.month_slice(start, end)
+        tiles = self.tile_positions(areas)
+        sources = self.source_positions(source)
+        sub = values[:, :, months][np.ix_(sources, tiles)]
+        present = self.present[:, :, months][np.ix_(sources, tiles)]
+        return sub, present, self.months[months]
+
+    def monthly_totals(self, areas, start, end, source=None):
+        """
+        Total titik panas per bulan untuk filter tertentu.
+
+        Returns:
+            Series index tanggal (hanya bulan yang punya data), nilai total titik panas
+        """
+        sub, present, months = self.select(self.hotspots, areas, start, end, source)
+        has_data = present.any(axis=(0, 1))
+        totals = sub.sum(axis=(0, 1))
+        return pd.Series(totals[has_data], index=pd.DatetimeIndex(months[has_data]), name='titik_panas')
+
+    def monthly_mean(self, values, areas, start, end, source=None):
+        """Rata-rata nilai per bulan (hanya sel yang ada datanya)"""
+        sub, present, months = self.select(values, areas, start, end, source)
+        counts = present.sum(axis=(0, 1))
+        has_data = counts > 0
+        means = sub.sum(axis=(0, 1))[has_data] / counts[has_data]
+        return pd.Series(means, index=pd.DatetimeIndex(months[has_data]))
+
+    def monthly_frame(self, areas, start, end, source=None):
+        """Agregat bulanan (total titik panas, rata-rata curah hujan) sebagai DataFrame"""
+        totals = self.monthly_totals(areas, start, end, source)
+        rainfall = self.monthly_mean(self.rainfall, areas, start, end, source)
+        return pd.DataFrame({
+            'tanggal': totals.index,
+            'titik_panas': totals.to_numpy(),
+            'curah_hujan': rainfall.to_numpy()
+        })
@@ -0,0 +1,374 @@
+import os
+
+import pandas as pd
+import numpy as np
+
+from quartile_thresholds import CATEGORY_LABELS, category_codes, compute_quartile_thresholds, \
+    thresholds_to_array, thresholds_to_dict
+from spatial_features import TileAdjacency, spatial_features
+from tile_geometry import TileIndex
+from weather_synthesis import (
+    DEFAULT_SEED, SOURCE_CODES, NoiseField, month_ordinal, synthesize_weather
+)
+
+# Folder script statistik (berisi model forecast tambahan)
+STATS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'untuk ngecek statistik')
+
+# Mapping tile ID to location names
+TILE_LOCATION_MAP = {
+    1: "Blok SK 1", 2: "Blok SK 2", 3: "Blok SK 3",
+    4: "Blok SK 4", 5: "Blok SK 5",
+    6: "Blok TP 1", 7: "Blok TP 2", 8: "Blok TP 3",
+    9: "Blok TP 4", 10: "Blok TP 5",
+    11: "Blok SR 1", 12: "Blok SR 2", 13: "Blok SR 3",
+    14: "Blok SR 4", 15: "Blok SR 5",
+    16: "Blok BA 1", 17: "Blok BA 2", 18: "Blok BA 3",
+    19: "Blok BA 4", 20: "Blok BA 5",
+    21: "Blok KB 1", 22: "Blok KB 2", 23: "Blok KB 3",
+    24: "Blok KB 4", 25: "Blok KB 5"
+}
+
+# Kode blok kecamatan pada nama area ("Blok SK 1" -> SK)
+REGION_NAMES = {
+    'SK': 'Sungai Kakap',
+    'TP': 'Teluk Pakedai',
+    'SR': 'Sungai Raya',
+    'BA': 'Batu Ampar',
+    'KB': 'Kubu Raya',
+}
+
+# Bulan musim kemarau (April - Oktober)
+DRY_SEASON_MONTHS = [4, 5, 6, 7, 8, 9, 10]
+
+# Mapping kategori Inggris (output script threshold) ke Bahasa Indonesia
+CATEGORY_TRANSLATION = {'High': 'Tinggi', 'Medium': 'Sedang', 'Low': 'Rendah'}
+CATEGORY_LABELS_ID = np.array([CATEGORY_TRANSLATION[label] for label in CATEGORY_LABELS], dtype=object)
+
+# Tahun data forecast yang dipakai untuk menghitung threshold kuartil
+# (sama seperti load_quartile_thresholds pada script statistik)
+THRESHOLD_YEAR = 2025
+
+# Urutan tingkat risiko dari terendah ke tertinggi
+RISK_LEVELS = ['Rendah', 'Sedang', 'Tinggi', 'Sangat Tinggi']
+
+# Skor risiko untuk data dengan kategori dari threshold kuartil
+CATEGORY_RISK_SCORE = {'Tinggi': 60, 'Sedang': 40, 'Rendah': 20}
+
+# File sumber dataset (relatif terhadap direktori kerja dashboard)
+SOURCE_FILES = {
+    'historical': 'monthly_hotspot_sum.csv',
+    'forecast': 'monthly_hotspot_forecasts_2025_new.csv',
+    'tiles': 'pontianak_tile_boundaries.csv',
+    'weather': 'Kuburaya Dalam angka 2014-2024.csv',
+}
+
+# Data realisasi/aktual 2025 untuk validasi model
+VALIDATION_FILE = 'real_monthly_hotspot_sum2025.csv'
+
+LONG_COLUMNS = [
+    'tanggal', 'area', 'tile_id', 'latitude', 'longitude', 'titik_panas',
+    'curah_hujan', 'sinaran_matahari', 'kecepatan_angin', 'arah_angin',
+    'suhu', 'kelembaban', 'ffmc', 'ispu', 'tingkat_risiko', 'skor_risiko',
+    'musim', 'sumber_data', 'titik_panas_tetangga', 'lag_spasial', 'klaster_titik_panas',
+    'skor_risiko_spasial'
+]
+
+# Bobot spatial lag (rata-rata titik panas tile tetangga) pada skor_risiko_spasial:
+# setengah bobot titik panas di tile sendiri (5), jadi tetangga yang rata-rata
+# punya 1 titik panas menambah skor setara 0,5 titik panas lokal. skor_risiko dan
+# tingkat_risiko tidak memakai lag agar kategori historis tetap sama.
+SPATIAL_LAG_WEIGHT = 2.5
+
+# Kategori tetap untuk kolom string (urutan = urutan kode kategori)
+AREA_NAMES = list(TILE_LOCATION_MAP.values())
+SEASONS = ['Hujan', 'Kemarau']
+SOURCE_LABELS = ['Realisasi', 'Prakiran']
+
+# Skema dtype ringkas data long-format; dipakai saat build dan saat membaca cache.
+# titik_panas tetap float karena nilai prakiran berupa pecahan.
+DATASET_SCHEMA = {
+    'area': pd.CategoricalDtype(AREA_NAMES),
+    'tile_id': np.int16,
+    'titik_panas': np.float32,
+    'curah_hujan': np.float32,
+    'sinaran_matahari': np.float32,
+    'kecepatan_angin': np.float32,
+    'arah_angin': np.float32,
+    'suhu': np.float32,
+    'kelembaban': np.float32,
+    'ffmc': np.float32,
+    'ispu': np.int16,
+    'tingkat_risiko': pd.CategoricalDtype(RISK_LEVELS, ordered=True),
+    'skor_risiko': np.float32,
+    'musim': pd.CategoricalDtype(SEASONS),
+    'sumber_data': pd.CategoricalDtype(SOURCE_LABELS),
+    'titik_panas_tetangga': np.float32,
+    'lag_spasial': np.float32,
+    'klaster_titik_panas': np.bool_,
+    'skor_risiko_spasial': np.float32,
+}
+
+
+def tile_columns(tile_ids):
+    """Nama kolom wide (tile_1, tile_2, ...) untuk daftar tile id"""
+    return [f'tile_{tile_num}' for tile_num in tile_ids]
+
+
+def apply_schema(df, schema=DATASET_SCHEMA):
+    """
+    Samakan dtype kolom dengan skema ringkas (tanpa copy jika dtype sudah sesuai).
+
+    Nilai area di luar AREA_NAMES (tile baru tanpa nama) ditambahkan sebagai
+    kategori agar tidak menjadi NaN.
+    """
+    changes = {}
+    for col, dtype in schema.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        if col == 'area':
+            extra = sorted(set(df[col].unique()) - set(dtype.categories))
+            dtype = pd.CategoricalDtype(list(dtype.categories) + extra)
+            if df[col].dtype == dtype:
+                continue
+        changes[col] = df[col].astype(dtype)
+    return df.assign(**changes) if changes else df
+
+
+def region_code(areas):
+    """Kode blok kecamatan (SK/TP/SR/BA/KB) untuk array nama area"""
+    return pd.Series(areas, dtype=object).str.extract(r'^Blok (\w+) ', expand=False).to_numpy()
+
+
+def clean_weather_data(weather_df):
+    """
+    Bersihkan data cuaca Kuburaya Dalam Angka menjadi satu baris per bulan.
+
+    Returns:
+        DataFrame dengan index 'YYYY-MM' dan kolom rainfall, solar_radiation,
+        wind_speed (NaN jika data tidak tersedia)
+    """
+    weather_df = weather_df.copy()
+    weather_df['Time'] = pd.to_datetime(weather_df['Time'])
+    weather_df = weather_df.rename(columns={
+        'Time': 'year_month',
+        'penyinaran matahari': 'solar_radiation_raw',
+        'avg kecepatan angin(knot)': 'wind_speed_knot',
+        'arah angin terbanyak': 'wind_direction_raw',
+        'curah hujan(mm)': 'rainfall_raw'
+    })
+    weather_df = weather_df[weather_df['year_month'].notna()]
+
+    # Convert knots to m/s (1 knot = 0.514444 m/s)
+    wind_speed = pd.to_numeric(weather_df['wind_speed_knot'], errors='coerce') * 0.514444
+
+    # Clean rainfall data (remove commas and convert)
+    rainfall = pd.to_numeric(
+        weather_df['rainfall_raw'].astype(str).str.replace(',', '.'), errors='coerce'
+    )
+
+    # Convert solar radiation percentage to W/m² (approximate conversion)
+    # Assuming max solar radiation ~1000 W/m² at 100%
+    solar_radiation = pd.to_numeric(weather_df['solar_radiation_raw'], errors='coerce') * 10
+
+    weather = pd.DataFrame({
+        'rainfall': rainfall.to_numpy(dtype=float),
+        'solar_radiation': solar_radiation.to_numpy(dtype=float),
+        'wind_speed': wind_speed.to_numpy(dtype=float),
+    }, index=weather_df['year_month'].dt.strftime('%Y-%m'))
+
+    # Jika ada bulan duplikat, baris terakhir yang dipakai (sama seperti lookup dict)
+    return weather[~weather.index.duplicated(keep='last')]
+
+
+def forecast_quartiles(forecast_df, tile_ids, year=THRESHOLD_YEAR):
+    """Threshold Q25/Q50/Q75 per tile dari data forecast tahun tertentu (array 3 x n_tiles)"""
+    dates = pd.to_datetime(forecast_df['year_month'])
+    train = forecast_df.loc[(dates.dt.year == year).to_numpy(), tile_columns(tile_ids)]
+    return compute_quartile_thresholds(train.to_numpy(dtype=float))
+
+
+def forecast_categories(forecast_df, tile_ids, quartiles):
+    """
+    Kategorikan nilai forecast numerik langsung (tanpa CSV kategori perantara).
+
+    Returns:
+        DataFrame index 'YYYY-MM', kolom tile id, nilai Tinggi/Sedang/Rendah
+    """
+    keys = pd.to_datetime(forecast_df['year_month']).dt.strftime('%Y-%m').to_numpy()
+    codes = category_codes(forecast_df[tile_columns(tile_ids)].to_numpy(dtype=float), quartiles)
+    categories = pd.DataFrame(CATEGORY_LABELS_ID[codes], index=keys, columns=list(tile_ids))
+    return categories[~categories.index.duplicated(keep='last')]
+
+
+def build_long_frame(historical_df, forecast_df, categories, tile_index, weather_df,
+                     seed=DEFAULT_SEED):
+    """
+    Bangun data long-format (satu baris per bulan x tile) secara vektorisasi.
+
+    Semua kolom turunan (cuaca, FFMC, fitur spasial, skor/tingkat risiko, ISPU) dihitung
+    sebagai ekspresi array NumPy atas seluruh baris sekaligus. Kategori risiko
+    2025 diambil dari matriks `categories` (lihat forecast_categories). Geometri tile
+    dibaca dari TileIndex (lihat tile_geometry.py). Noise simulasi cuaca
+    ditentukan oleh seed sehingga hasilnya reproducible antar proses.
+    """
+    tile_ids = tile_index.ids
+    cols = tile_columns(tile_ids)
+
+    # Mark data sources before combining
+    historical_df = historical_df.assign(sumber_data='Realisasi')
+    forecast_df = forecast_df.assign(sumber_data='Prakiran')
+    combined_df = pd.concat([historical_df, forecast_df], ignore_index=True)
+
+    n_months = len(combined_df)
+    n_tiles = len(tile_ids)
+
+    # Melt: urutan baris = bulan, lalu tile (sama seperti loop lama)
+    dates = pd.to_datetime(combined_df['year_month']).to_numpy()
+    month_keys = pd.DatetimeIndex(dates).strftime('%Y-%m').to_numpy()
+    hotspot = combined_df[cols].to_numpy(dtype=float).ravel()
+    tile_id = np.tile(tile_ids, n_months)
+    row_month = np.repeat(np.arange(n_months), n_tiles)
+    row_tile = np.tile(np.arange(n_tiles), n_months)
+
+    # Join tile centroids once (urutan array TileIndex = urutan tile_ids)
+    lat_tile = tile_index.center_lat
+    lon_tile = tile_index.center_lon
+    area_tile = np.array([TILE_LOCATION_MAP.get(t, f"Tile {t}") for t in tile_ids], dtype=object)
+
+    # Join weather once (per bulan), lalu broadcast ke tiap tile
+    weather = clean_weather_data(weather_df).reindex(month_keys)
+    month_of_year = pd.DatetimeIndex(dates).month.to_numpy()
+    is_dry_month = np.isin(month_of_year, DRY_SEASON_MONTHS)
+
+    is_dry = is_dry_month[row_month]
+    sumber_data = combined_df['sumber_data'].to_numpy()[row_month]
+
+    # Cuaca dan ISPU: data real jika tersedia, selain itu simulasi deterministik
+    noise = NoiseField(
+        seed,
+        month_ordinal(dates)[row_month],
+        pd.Series(sumber_data).map(SOURCE_CODES).to_numpy(),
+        row_tile,
+        n_tiles
+    )
+    synthesized = synthesize_weather(hotspot, is_dry, {
+        'rainfall': weather['rainfall'].to_numpy()[row_month],
+        'solar_radiation': weather['solar_radiation'].to_numpy()[row_month],
+        'wind_speed': weather['wind_speed'].to_numpy()[row_month],
+    }, noise)
+    rainfall = synthesized['curah_hujan']
+    temperature = synthesized['suhu']
+    wind_speed = synthesized['kecepatan_angin']
+
+    # Fitur spasial semua bulan sekaligus (satu perkalian matriks sparse tile x bulan)
+    spatial = spatial_features(TileAdjacency(tile_index), hotspot.reshape(n_months, n_tiles).T)
+    neighbour_sum = spatial['neighbour_sum'].T.ravel()
+    spatial_lag = spatial['spatial_lag'].T.ravel()
+
+    # FFMC calculation
+    ffmc = np.clip(60 + hotspot * 2 - rainfall * 0.1, 20, 95)
+
+    # Calculate risk for historical data
+    risk_score = (
+        hotspot * 5 +
+        np.maximum(0, 100 - rainfall / 3) * 0.25 +
+        np.maximum(0, temperature - 26) * 0.15 +
+        np.maximum(0, ffmc - 40) * 0.15 +
+        np.maximum(0, wind_speed - 2) * 0.10
+    )
+    risk_level = np.select(
+        [risk_score > 70, risk_score > 50, risk_score > 30],
+        ["Sangat Tinggi", "Tinggi", "Sedang"],
+        default="Rendah"
+    ).astype(object)
+
+    # 2025: gunakan kategori risiko dari threshold kuartil
+    year = pd.DatetimeIndex(dates).year.to_numpy()
+    month_in_cat = (year == 2025) & np.isin(month_keys, categories.index)
+    if month_in_cat.any():
+        cat_rows = categories.reindex(month_keys[month_in_cat]).to_numpy().ravel()
+        use_cat = month_in_cat[row_month]
+        risk_level[use_cat] = cat_rows
+        risk_score[use_cat] = pd.Series(cat_rows).map(CATEGORY_RISK_SCORE).to_numpy(dtype=float)
+
+    return apply_schema(pd.DataFrame({
+        'tanggal': dates[row_month],
+        'area': area_tile[row_tile],
+        'tile_id': tile_id,
+        'latitude': lat_tile[row_tile],
+        'longitude': lon_tile[row_tile],
+        'titik_panas': hotspot,
+        'curah_hujan': rainfall,
+        'sinaran_matahari': synthesized['sinaran_matahari'],
+        'kecepatan_angin': wind_speed,
+        'arah_angin': synthesized['arah_angin'],
+        'suhu': temperature,
+        'kelembaban': synthesized['kelembaban'],
+        'ffmc': ffmc,
+        'ispu': synthesized['ispu'],
+        'tingkat_risiko': risk_level,
+        'skor_risiko': risk_score,
+        'musim': np.where(is_dry, 'Kemarau', 'Hujan').astype(object),
+        'sumber_data': sumber_data,
+        'titik_panas_tetangga': neighbour_sum,
+        'lag_spasial': spatial_lag,
+        'klaster_titik_panas': spatial['cluster'].T.ravel(),
+        'skor_risiko_spasial': risk_score + spatial_lag * SPATIAL_LAG_WEIGHT,
+    }, columns=LONG_COLUMNS))
+
+
+def build_validation_frame(val_df):
+    """Ubah data aktual wide (satu kolom per tile) menjadi long-format untuk validasi"""
+    # Mengubah format data dari lebar (wide) ke panjang (long) agar cocok dengan data forecast
+    val_melted = val_df.melt(
+        id_vars=['year_month'],
+        var_name='tile_str',
+        value_name='titik_panas_aktual'
+    )
+
+    # Membersihkan kolom tile_id (mengubah 'tile_1' menjadi angka 1)
+    val_melted['tile_id'] = val_melted['tile_str'].str.replace('tile_', '').astype(int)
+
+    # Mengubah format tanggal
+    val_melted['tanggal'] = pd.to_datetime(val_melted['year_month'])
+
+    val_melted = val_melted.sort_values(['tanggal', 'tile_id'], kind='stable')
+    return val_melted[['tanggal', 'tile_id', 'titik_panas_aktual']].reset_index(drop=True)
+
+
+def build_forecast_block(forecast_df, quartiles, seed=DEFAULT_SEED, source_files=SOURCE_FILES):
+    """
+    Baris long-format Prakiran untuk satu forecast wide (mis. model selain model utama).
+
+    Semua kolom turunan (cuaca, FFMC, ISPU, fitur spasial, skor/tingkat risiko)
+    dihitung dari nilai forecast tersebut, dengan kategori 2025 dari `quartiles`.
+    """
+    tile_index = TileIndex.from_csv(source_files['tiles'])
+    return build_long_frame(
+        forecast_df.iloc[0:0],
+        forecast_df,
+        forecast_categories(forecast_df, tile_index.ids, quartiles),
+        tile_index,
+        pd.read_csv(source_files['weather']),
+        seed=seed
+    )
+
+
+def build_dataset(seed=DEFAULT_SEED, source_files=SOURCE_FILES, quartiles=None):
+    """
+    Baca semua file sumber lalu bangun data long-format.
+
+    Threshold kuartil dihitung dari data forecast jika quartiles tidak diberikan.
+    """
+    forecast_df = pd.read_csv(source_files['forecast'])
+    tile_index = TileIndex.from_csv(source_files['tiles'])
+    if quartiles is None:
+        quartiles = forecast_quartiles(forecast_df, tile_index.ids)
+    return build_long_frame(
+        pd.read_csv(source_files['historical']),
+        forecast_df,
+        forecast_categories(forecast_df, tile_index.ids, quartiles),
+        tile_index,
+        pd.read_csv(source_files['weather']),
+        seed=seed
+    )
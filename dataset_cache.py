@@ -0,0 +1,310 @@
+# Cache on-disk (Arrow IPC / Feather, tanpa kompresi) untuk dataset long-format.
+# Nama file memuat hash isi + mtime file sumber dan seed simulasi, lalu dibaca
+# dengan memory-map. Build manual saat deploy: python dataset_cache.py
+#
+# Jika hanya data titik panas bulanan (monthly_hotspot_sum.csv / data aktual
+# 2025) yang berubah, cache diperbarui secara inkremental: hanya bulan baru atau
+# berubah yang dihitung ulang, berdasarkan hash per baris yang disimpan di
+# manifest.json. Threshold kuartil kategori risiko juga disimpan di manifest.
+import glob
+import hashlib
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from data_pipeline import SOURCE_FILES, VALIDATION_FILE, apply_schema, build_dataset, \
+    build_long_frame, build_validation_frame, forecast_categories, forecast_quartiles, thresholds_to_array, \
+    thresholds_to_dict, tile_columns
+from incremental_ingest import canonical_order, diff_months, merge_months, row_hashes
+from tile_geometry import TileIndex
+from weather_synthesis import DEFAULT_SEED
+
+CACHE_DIR = '.cache'
+CACHE_SUFFIX = '.arrow'
+MANIFEST_FILE = 'manifest.json'
+
+# Naikkan jika logika transformasi berubah agar cache lama tidak dipakai
+CACHE_VERSION = 8
+
+# File sumber yang diperbarui bulanan dan bisa di-ingest secara inkremental
+INCREMENTAL_SOURCES = ('historical',)
+
+
+def file_digest(digest, key, path):
+    """Tambahkan isi + mtime satu file ke hash (file yang tidak ada ikut dicatat)"""
+    if path is None or not os.path.exists(path):
+        digest.update(f'|{key}|missing|'.encode())
+        return
+    digest.update(f'|{key}|{os.stat(path).st_mtime_ns}|'.encode())
+    with open(path, 'rb') as f:
+        digest.update(hashlib.sha256(f.read()).digest())
+
+
+def static_fingerprint(source_files=SOURCE_FILES, seed=DEFAULT_SEED):
+    """Hash file sumber yang tidak di-ingest inkremental, seed dan versi cache"""
+    digest = hashlib.sha256(f'v{CACHE_VERSION}|seed={seed}'.encode())
+    for key in sorted(source_files):
+        if key not in INCREMENTAL_SOURCES:
+            file_digest(digest, key, source_files[key])
+    return digest.hexdigest()[:16]
+
+
+def input_fingerprint(source_files=SOURCE_FILES, seed=DEFAULT_SEED,
+                      validation_file=VALIDATION_FILE):
+    """Hash SHA-256 dari isi + mtime semua file sumber, seed dan versi cache"""
+    digest = hashlib.sha256(static_fingerprint(source_files, seed).encode())
+    for key in INCREMENTAL_SOURCES:
+        file_digest(digest, key, source_files[key])
+    file_digest(digest, 'validation', validation_file)
+    return digest.hexdigest()[:16]
+
+
+def source_signature(source_files=SOURCE_FILES, validation_file=VALIDATION_FILE):
+    """Tanda tangan murah (path, mtime, ukuran) file sumber, untuk key st.cache_data"""
+    signature = []
+    for path in list(source_files.values()) + [validation_file]:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        else:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def cache_path(kind, fingerprint, cache_dir=CACHE_DIR):
+    """Lokasi file cache (kind: dataset/validation) untuk fingerprint tertentu"""
+    return os.path.join(cache_dir, f'{kind}_{fingerprint}{CACHE_SUFFIX}')
+
+
+def write_cache(df, path):
+    """Tulis DataFrame ke file Arrow secara atomik (tmp lalu rename)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def read_cache(path):
+    """Baca file cache dengan memory-map"""
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def read_manifest(cache_dir=CACHE_DIR):
+    """Baca manifest cache (None jika tidak ada atau rusak)"""
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(manifest, cache_dir=CACHE_DIR):
+    """Tulis manifest cache secara atomik"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, MANIFEST_FILE)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def prune_cache(keep_paths, cache_dir=CACHE_DIR):
+    """Hapus file cache lama selain keep_paths"""
+    keep = {os.path.abspath(p) for p in keep_paths if p}
+    for path in glob.glob(os.path.join(cache_dir, f'*{CACHE_SUFFIX}')):
+        if os.path.abspath(path) not in keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _read_validation_source(validation_file):
+    if validation_file is None or not os.path.exists(validation_file):
+        return None
+    return pd.read_csv(validation_file)
+
+
+def _full_build(seed, source_files, validation_file):
+    """Bangun ulang seluruh dataset dan data validasi"""
+    tile_ids = TileIndex.from_csv(source_files['tiles']).ids
+    quartiles = forecast_quartiles(pd.read_csv(source_files['forecast']), tile_ids)
+    df = canonical_order(build_dataset(seed=seed, source_files=source_files, quartiles=quartiles))
+    val_source = _read_validation_source(validation_file)
+    frames = {
+        'dataset': df,
+        'validation': None if val_source is None else build_validation_frame(val_source),
+    }
+    hashes = {
+        'historical': row_hashes(pd.read_csv(source_files['historical'])),
+        'validation': None if val_source is None else row_hashes(val_source),
+    }
+    return frames, hashes, thresholds_to_dict(tile_columns(tile_ids), quartiles)
+
+
+def _incremental_build(manifest, seed, source_files, validation_file):
+    """
+    Perbarui cache lama hanya untuk bulan yang baru/berubah.
+
+    Returns:
+        (frames, hashes, thresholds) atau None jika cache lama tidak bisa dipakai
+    """
+    previous = {}
+    for kind in ('dataset', 'validation'):
+        path = manifest['files'].get(kind)
+        if path is None:
+            previous[kind] = None
+            continue
+        if not os.path.exists(path):
+            return None
+        previous[kind] = read_cache(path)
+
+    historical_df = pd.read_csv(source_files['historical'])
+    current_hashes = row_hashes(historical_df)
+    changed, removed = diff_months(manifest['row_hashes']['historical'], current_hashes)
+
+    df = previous['dataset']
+    if changed or removed:
+        # Hitung kolom turunan hanya untuk bulan baru/berubah
+        new_rows = df.iloc[0:0]
+        if changed:
+            keys = pd.to_datetime(historical_df['year_month']).dt.strftime('%Y-%m')
+            tile_index = TileIndex.from_csv(source_files['tiles'])
+            quartiles = thresholds_to_array(
+                manifest['quartile_thresholds'], tile_columns(tile_index.ids)
+            )
+            new_rows = build_long_frame(
+                historical_df[keys.isin(changed).to_numpy()],
+                historical_df.iloc[0:0],
+                forecast_categories(pd.read_csv(source_files['forecast']), tile_index.ids, quartiles),
+                tile_index,
+                pd.read_csv(source_files['weather']),
+                seed=seed
+            )
+        affected = changed + removed
+        df = canonical_order(merge_months(
+            df, new_rows, affected,
+            drop_mask=(df['sumber_data'] == 'Realisasi').to_numpy()
+        ))
+
+    # Data aktual untuk validasi
+    val_source = _read_validation_source(validation_file)
+    validation = previous['validation']
+    val_hashes = None
+    if val_source is None:
+        validation = None
+    else:
+        val_hashes = row_hashes(val_source)
+        old_val_hashes = manifest['row_hashes'].get('validation')
+        if validation is None or old_val_hashes is None:
+            validation = build_validation_frame(val_source)
+        else:
+            val_changed, val_removed = diff_months(old_val_hashes, val_hashes)
+            if val_changed or val_removed:
+                keys = pd.to_datetime(val_source['year_month']).dt.strftime('%Y-%m')
+                new_val = build_validation_frame(val_source[keys.isin(val_changed).to_numpy()])
+                validation = merge_months(validation, new_val, val_changed + val_removed)
+                validation = validation.sort_values(['tanggal', 'tile_id'], kind='stable')
+                validation = validation.reset_index(drop=True)
+
+    frames = {'dataset': apply_schema(df), 'validation': validation}
+    hashes = {'historical': current_hashes, 'validation': val_hashes}
+    return frames, hashes, manifest['quartile_thresholds']
+
+
+def sync_cache(seed=DEFAULT_SEED, source_files=SOURCE_FILES,
+               validation_file=VALIDATION_FILE, cache_dir=CACHE_DIR):
+    """
+    Pastikan cache sesuai dengan file sumber saat ini.
+
+    - Fingerprint sama: cache dipakai apa adanya
+    - Hanya data titik panas bulanan berubah: update inkremental
+    - Selain itu: build ulang penuh
+
+    Returns:
+        dict kind -> path file cache ('validation' bernilai None jika file aktual tidak ada)
+    """
+    fingerprint = input_fingerprint(source_files, seed, validation_file)
+    manifest = read_manifest(cache_dir)
+    if manifest is not None and manifest.get('fingerprint') == fingerprint:
+        if all(p is None or os.path.exists(p) for p in manifest['files'].values()):
+            return manifest['files']
+
+    static = static_fingerprint(source_files, seed)
+    result = None
+    if manifest is not None and manifest.get('static_fingerprint') == static:
+        try:
+            result = _incremental_build(manifest, seed, source_files, validation_file)
+        except (OSError, KeyError, pa.ArrowInvalid):
+            result = None
+    if result is None:
+        result = _full_build(seed, source_files, validation_file)
+    frames, hashes, thresholds = result
+
+    files = {}
+    for kind, frame in frames.items():
+        if frame is None:
+            files[kind] = None
+            continue
+        files[kind] = cache_path(kind, fingerprint, cache_dir)
+        write_cache(frame, files[kind])
+
+    write_manifest({
+        'version': CACHE_VERSION,
+        'seed': seed,
+        'fingerprint': fingerprint,
+        'static_fingerprint': static,
+        'files': files,
+        'row_hashes': hashes,
+        'quartile_thresholds': thresholds,
+    }, cache_dir)
+    prune_cache(files.values(), cache_dir)
+    return files
+
+
+def load_dataset(seed=DEFAULT_SEED, source_files=SOURCE_FILES, cache_dir=CACHE_DIR):
+    """
+    Load dataset long-format dari cache (diperbarui/dibangun jika perlu).
+
+    Returns:
+        DataFrame long-format dengan dtype DATASET_SCHEMA (sama seperti build_dataset)
+    """
+    files = sync_cache(seed=seed, source_files=source_files, cache_dir=cache_dir)
+    return apply_schema(read_cache(files['dataset']))
+
+
+def load_quartiles(tile_ids, seed=DEFAULT_SEED, source_files=SOURCE_FILES, cache_dir=CACHE_DIR):
+    """
+    Threshold kuartil kategori risiko yang dipakai saat cache dibangun.
+
+    Returns:
+        array (3, n_tiles) untuk tile_ids (dibaca dari manifest.json)
+    """
+    sync_cache(seed=seed, source_files=source_files, cache_dir=cache_dir)
+    manifest = read_manifest(cache_dir)
+    return thresholds_to_array(manifest['quartile_thresholds'], tile_columns(tile_ids))
+
+
+def load_validation(seed=DEFAULT_SEED, source_files=SOURCE_FILES,
+                    validation_file=VALIDATION_FILE, cache_dir=CACHE_DIR):
+    """Load data aktual long-format untuk validasi (None jika file tidak ada)"""
+    files = sync_cache(seed=seed, source_files=source_files,
+                       validation_file=validation_file, cache_dir=cache_dir)
+    if files['validation'] is None:
+        return None
+    return read_cache(files['validation'])
+
+
+def main():
+    """Build cache dataset dari command line"""
+    files = sync_cache()
+    for kind, path in files.items():
+        print(f"Cache {kind}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import math
+import threading
+
+import pandas as pd
+import numpy as np
+
+DEFAULT_PAGE_SIZE = 50
+
+# Kolom yang ditampilkan di tabel rinci beserta judulnya
+DETAIL_COLUMNS = {
+    'tanggal': 'Bulan',
+    'area': 'Lokasi',
+    'tile_id': 'Tile',
+    'sumber_data': 'Sumber',
+    'titik_panas': 'Titik Panas',
+    'titik_panas_tetangga': 'Titik Panas Tetangga',
+    'curah_hujan': 'Curah Hujan (mm)',
+    'suhu': 'Suhu (°C)',
+    'kelembaban': 'Kelembaban (%)',
+    'ffmc': 'FFMC',
+    'ispu': 'ISPU',
+    'skor_risiko': 'Skor Risiko',
+    'skor_risiko_spasial': 'Skor Risiko + Lag Spasial',
+    'tingkat_risiko': 'Kategori Risiko',
+    'musim': 'Musim',
+}
+
+
+class DetailTable:
+    """
+    Tabel rinci tile x bulan dengan filter, sort dan paginasi di server.
+
+    Kolom disimpan sebagai array NumPy dari dataset yang sudah di-cache.
+    Urutan sort per kolom (argsort stabil; kolom kategori memakai kode kategori
+    agar mengikuti urutan yang dideklarasikan) dihitung sekali lalu dipakai ulang;
+    filter menjadi mask boolean, dan hanya baris di halaman yang diminta yang
+    diambil menjadi DataFrame untuk dikirim ke browser.
+    """
+
+    def __init__(self, df, columns=None):
+        self.columns = list(DETAIL_COLUMNS if columns is None else columns)
+        self._df = df
+        self._arrays = {col: df[col].to_numpy() for col in self.columns}
+        # Key sort: kode kategori untuk kolom kategori (nilai kosong di akhir),
+        # array asli untuk kolom lain; array string hanya untuk tampilan
+        self._sort_keys = {col: self._sort_key(df[col]) for col in self.columns}
+        self._missing = {col: df[col].isna().to_numpy() for col in self.columns}
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._df)
+
+    @staticmethod
+    def _sort_key(series):
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            return series.to_numpy()
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes < 0, len(series.cat.categories), codes)
+
+    def sort_order(self, column):
+        """Posisi baris terurut naik untuk satu kolom (dihitung sekali)"""
+        with self._lock:
+            order = self._orders.get(column)
+        if order is None:
+            order = np.argsort(self._sort_keys[column], kind='stable')
+            order.flags.writeable = False
+            with self._lock:
+                order = self._orders.setdefault(column, order)
+        return order
+
+    def mask(self, start=None, end=None, areas=None, sources=None, risk_levels=None,
+             min_hotspots=None):
+        """Mask baris untuk kombinasi filter (None/kosong berarti tidak difilter)"""
+        mask = np.ones(len(self), dtype=bool)
+        dates = self._arrays['tanggal']
+        if start is not None:
+            mask &= dates >= np.datetime64(pd.Timestamp(start))
+        if end is not None:
+            mask &= dates <= np.datetime64(pd.Timestamp(end))
+        if areas:
+            mask &= np.isin(self._arrays['area'], list(areas))
+        if sources:
+            mask &= np.isin(self._arrays['sumber_data'], list(sources))
+        if risk_levels:
+            mask &= np.isin(self._arrays['tingkat_risiko'], list(risk_levels))
+        if min_hotspots is not None:
+            mask &= self._arrays['titik_panas'] >= min_hotspots
+        return mask
+
+    def page(self, page=1, page_size=DEFAULT_PAGE_SIZE, sort_by='tanggal', ascending=True,
+             **filters):
+        """
+        Ambil satu halaman hasil filter + sort.
+
+        Returns:
+            (page_df, total_rows, n_pages); page_df memakai judul kolom DETAIL_COLUMNS
+        """
+        order = self.sort_order(sort_by)
+        if not ascending:
+            # Balik urutan, tetapi nilai kosong tetap di akhir
+            order = order[::-1]
+            missing = self._missing[sort_by][order]
+            if missing.any():
+                order = np.concatenate([order[~missing], order[missing]])
+        rows = order[self.mask(**filters)[order]]
+
+        total = len(rows)
+        n_pages = max(1, math.ceil(total / page_size))
+        page = min(max(1, int(page)), n_pages)
+        visible = rows[(page - 1) * page_size:page * page_size]
+
+        page_df = pd.DataFrame({
+            DETAIL_COLUMNS.get(col, col): self._arrays[col][visible] for col in self.columns
+        })
+        return page_df, total, n_pages
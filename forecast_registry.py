@@ -0,0 +1,160 @@
+# Registry model forecast: semua file *forecast*.csv (format wide year_month x
+# tile_N) di folder dashboard dan folder script statistik didaftarkan sebagai
+# model, tapi baru dibaca saat model tersebut dipilih. Semua model di-reindex ke
+# indeks bulan x tile yang sama. Mengganti model membangun ulang hanya blok
+# baris Prakiran (beserta kolom turunannya); baris Realisasi tetap dipakai.
+import glob
+import hashlib
+import os
+import threading
+
+import pandas as pd
+import numpy as np
+
+from data_pipeline import SOURCE_FILES, STATS_DIR, apply_schema, build_forecast_block, tile_columns
+from incremental_ingest import canonical_order
+from weather_synthesis import DEFAULT_SEED
+
+FORECAST_PATTERN = '*forecast*.csv'
+FORECAST_DIRS = ('.', STATS_DIR)
+
+# File hasil kategorisasi (bukan nilai numerik) tidak didaftarkan
+EXCLUDED_PREFIXES = ('categorical_',)
+
+
+def model_name(path):
+    """Nama model dari nama file (tanpa ekstensi)"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+PRIMARY_MODEL = model_name(SOURCE_FILES['forecast'])
+
+
+def forecast_signature(search_dirs=FORECAST_DIRS, pattern=FORECAST_PATTERN,
+                       primary_file=SOURCE_FILES['forecast']):
+    """
+    Tanda tangan murah kandidat file forecast (path, mtime_ns, ukuran) tanpa
+    membaca isinya, untuk key st.cache_data. Model utama selalu lebih dulu.
+    """
+    paths = [primary_file] if os.path.exists(primary_file) else []
+    for directory in search_dirs:
+        paths.extend(sorted(glob.glob(os.path.join(directory, pattern))))
+
+    signature = []
+    for path in paths:
+        if os.path.basename(path).startswith(EXCLUDED_PREFIXES):
+            continue
+        stat = os.stat(path)
+        signature.append((os.path.normpath(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def discover_forecast_files(signature=None):
+    """
+    Daftar model dari kandidat file forecast (default: forecast_signature()).
+
+    Isi file hanya di-hash di sini untuk membuang duplikat (mis. salinan di
+    folder statistik), jadi panggil ulang hanya jika signature berubah.
+
+    Returns:
+        tuple (nama, path, mtime_ns, ukuran) -- murah di-hash sebagai key cache
+    """
+    if signature is None:
+        signature = forecast_signature()
+    files = []
+    seen_names = set()
+    seen_digests = set()
+    for path, mtime_ns, size in signature:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        name = model_name(path)
+        if digest in seen_digests or name in seen_names:
+            continue
+        seen_digests.add(digest)
+        seen_names.add(name)
+        files.append((name, path, mtime_ns, size))
+    return tuple(files)
+
+
+class ForecastRegistry:
+    """
+    Daftar model forecast dengan lazy loading.
+
+    Setiap model disimpan sebagai array read-only (bulan x tile) pada indeks
+    bersama `months` x `tile_ids`; sel yang tidak ada di file model bernilai NaN.
+    File CSV baru dibaca pada pemanggilan values() pertama untuk model itu.
+    """
+
+    def __init__(self, files, tile_ids, months):
+        self._paths = {name: path for name, path, *_ in files}
+        self.tile_ids = np.asarray(tile_ids)
+        self.months = pd.DatetimeIndex(months)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def names(self):
+        """Nama model yang terdaftar (model utama lebih dulu)"""
+        return list(self._paths)
+
+    def path(self, name):
+        return self._paths[name]
+
+    def is_loaded(self, name):
+        return name in self._values
+
+    def values(self, name):
+        """Nilai forecast model (array bulan x tile pada indeks bersama)"""
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+
+        model_df = pd.read_csv(self._paths[name])
+        keys = pd.to_datetime(model_df['year_month']).dt.to_period('M').dt.to_timestamp()
+        wide = model_df.reindex(columns=tile_columns(self.tile_ids))
+        wide.index = keys.to_numpy()
+        wide = wide[~wide.index.duplicated(keep='last')]
+        values = wide.reindex(self.months).to_numpy(dtype=float)
+        values.flags.writeable = False
+
+        with self._lock:
+            return self._values.setdefault(name, values)
+
+    def filled_values(self, name):
+        """
+        Nilai forecast model `name` seperti yang dipakai dashboard.
+
+        Sel yang tidak ada di file model memakai nilai model utama.
+        """
+        values = self.values(name)
+        if name != PRIMARY_MODEL and PRIMARY_MODEL in self._paths:
+            values = np.where(np.isnan(values), self.values(PRIMARY_MODEL), values)
+        return values
+
+    def model_frame(self, name):
+        """Forecast wide (year_month, tile_N) model `name` pada indeks bersama"""
+        values = self.filled_values(name)
+        frame = pd.DataFrame(values, columns=tile_columns(self.tile_ids))
+        frame.insert(0, 'year_month', self.months.strftime('%Y-%m'))
+        return frame
+
+    def with_model(self, df, name, quartiles, seed=DEFAULT_SEED, source_files=SOURCE_FILES):
+        """
+        Data long-format dengan baris Prakiran dari model `name`.
+
+        Blok Prakiran dibangun ulang dari nilai model (titik panas, cuaca, FFMC,
+        ISPU, fitur spasial, skor dan tingkat risiko dengan threshold `quartiles`),
+        sehingga kategori risiko selalu konsisten dengan nilai yang ditampilkan.
+        """
+        if name == PRIMARY_MODEL:
+            return df
+        block = build_forecast_block(self.model_frame(name), quartiles, seed, source_files)
+        forecast_rows = (df['sumber_data'] == 'Prakiran').to_numpy()
+        return canonical_order(apply_schema(pd.concat([df[~forecast_rows], block], ignore_index=True)))
+
+
+def build_registry(files, df):
+    """Registry dengan indeks bersama dari baris Prakiran dataset utama"""
+    forecast = df[df['sumber_data'] == 'Prakiran']
+    months = np.sort(forecast['tanggal'].unique())
+    tile_ids = np.sort(df['tile_id'].unique())
+    return ForecastRegistry(files, tile_ids, months)
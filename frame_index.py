@@ -0,0 +1,94 @@
+import pandas as pd
+import numpy as np
+
+from data_pipeline import SOURCE_LABELS
+
+
+class FrameIndex:
+    """
+    Indeks baris data long-format yang terurut (tanggal, sumber_data, tile_id).
+
+    Setiap pasangan bulan x sumber adalah blok baris kontigu dengan offset yang
+    dihitung sekali, sehingga rentang tanggal menjadi slice (view tanpa salin)
+    dan filter sumber/area menjadi take atas posisi baris di dalam slice itu,
+    bukan mask boolean atas seluruh DataFrame.
+    """
+
+    def __init__(self, df):
+        dates = df['tanggal'].to_numpy()
+        source = pd.Categorical(df['sumber_data'], categories=SOURCE_LABELS).codes
+        tile_id = df['tile_id'].to_numpy()
+        order = np.lexsort((tile_id, source, dates))
+        if not np.array_equal(order, np.arange(len(df))):
+            # Cache on-disk sudah terurut; urutkan sekali jika belum (mis. data uji)
+            df = df.iloc[order].reset_index(drop=True)
+            dates, source, tile_id = dates[order], source[order], tile_id[order]
+        self.df = df
+
+        # Posisi tile per baris (untuk take per area tanpa isin atas string)
+        self.tile_ids = np.unique(tile_id)
+        self._tile_pos = np.searchsorted(self.tile_ids, tile_id)
+        first_rows = np.unique(self._tile_pos, return_index=True)[1]
+        self.tile_areas = df['area'].to_numpy()[first_rows].astype(str)
+
+        # Offset baris per bulan dan per blok bulan x sumber
+        self.months, self.month_offsets = np.unique(dates, return_index=True)
+        self.month_offsets = np.append(self.month_offsets, len(df))
+        block_change = np.r_[True, (dates[1:] != dates[:-1]) | (source[1:] != source[:-1])]
+        self.block_offsets = np.append(np.flatnonzero(block_change), len(df))
+        self.block_source = source[self.block_offsets[:-1]]
+
+    def __len__(self):
+        return len(self.df)
+
+    def date_slice(self, start=None, end=None):
+        """Slice baris untuk rentang tanggal inklusif [start, end] (lookup offset bulan)"""
+        lo = 0 if start is None else np.searchsorted(self.months, np.datetime64(pd.Timestamp(start)), 'left')
+        hi = len(self.months) if end is None else \
+            np.searchsorted(self.months, np.datetime64(pd.Timestamp(end)), 'right')
+        return slice(int(self.month_offsets[lo]), int(self.month_offsets[hi]))
+
+    def source_rows(self, source, window):
+        """Posisi baris satu sumber di dalam slice (gabungan blok bulan x sumber)"""
+        code = SOURCE_LABELS.index(source)
+        lo = np.searchsorted(self.block_offsets, window.start, 'right') - 1
+        hi = np.searchsorted(self.block_offsets, window.stop, 'left')
+        blocks = np.arange(max(lo, 0), hi)
+        blocks = blocks[self.block_source[blocks] == code]
+        if len(blocks) == 0:
+            return np.empty(0, dtype=np.intp)
+        starts = np.maximum(self.block_offsets[blocks], window.start)
+        stops = np.minimum(self.block_offsets[blocks + 1], window.stop)
+        lengths = stops - starts
+        return np.repeat(starts - np.r_[0, np.cumsum(lengths)[:-1]], lengths) + np.arange(lengths.sum())
+
+    def tile_mask(self, areas=None):
+        """Boolean per posisi tile untuk daftar area (None jika tidak difilter/semua terpilih)"""
+        if not areas:
+            return None
+        selected = np.isin(self.tile_areas, list(areas))
+        return None if selected.all() else selected
+
+    def rows(self, start=None, end=None, areas=None, source=None):
+        """
+        Baris untuk kombinasi filter.
+
+        Returns:
+            slice jika hasilnya kontigu (hanya filter tanggal), selain itu array posisi
+        """
+        window = self.date_slice(start, end)
+        selected = self.tile_mask(areas)
+        if source is None and selected is None:
+            return window
+        positions = np.arange(window.start, window.stop) if source is None \
+            else self.source_rows(source, window)
+        if selected is not None:
+            positions = positions[selected[self._tile_pos[positions]]]
+        return positions
+
+    def view(self, start=None, end=None, areas=None, source=None):
+        """DataFrame hasil filter: view slice jika kontigu, selain itu take baris terpilih"""
+        rows = self.rows(start, end, areas, source)
+        if isinstance(rows, slice):
+            return self.df.iloc[rows]
+        return self.df.take(rows)
@@ -0,0 +1,64 @@
+import pandas as pd
+import numpy as np
+
+# Urutan sumber data pada dataset (Realisasi dulu, lalu Prakiran)
+SOURCE_ORDER = {'Realisasi': 0, 'Prakiran': 1}
+
+
+def month_keys(year_month):
+    """Normalisasi kolom year_month menjadi string 'YYYY-MM'"""
+    return pd.to_datetime(year_month).dt.strftime('%Y-%m')
+
+
+def row_hashes(wide_df):
+    """
+    Hash isi tiap baris CSV wide (satu baris per bulan).
+
+    Returns:
+        dict 'YYYY-MM' -> hash hex baris tersebut
+    """
+    keys = month_keys(wide_df['year_month'])
+    values = wide_df.drop(columns=['year_month'])
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    return {key: format(int(h), '016x') for key, h in zip(keys, hashes)}
+
+
+def diff_months(previous_hashes, current_hashes):
+    """
+    Bandingkan hash baris lama dan baru.
+
+    Returns:
+        (changed, removed): list bulan 'YYYY-MM' yang baru/berubah dan yang dihapus
+    """
+    changed = sorted(
+        key for key, h in current_hashes.items() if previous_hashes.get(key) != h
+    )
+    removed = sorted(set(previous_hashes) - set(current_hashes))
+    return changed, removed
+
+
+def canonical_order(df):
+    """
+    Urutkan data long-format berdasarkan (tanggal, sumber_data, tile_id), sehingga
+    setiap bulan x sumber menjadi blok baris kontigu (lihat frame_index.py)
+    """
+    source_rank = df['sumber_data'].astype(object).map(SOURCE_ORDER).fillna(len(SOURCE_ORDER)).to_numpy()
+    order = np.lexsort((df['tile_id'].to_numpy(), source_rank, df['tanggal'].to_numpy()))
+    return df.iloc[order].reset_index(drop=True)
+
+
+def merge_months(previous_df, new_rows, affected_months, drop_mask=None):
+    """
+    Ganti baris bulan yang terdampak dengan baris hasil hitung ulang.
+
+    Args:
+        previous_df: data long-format dari cache
+        new_rows: baris long-format untuk bulan baru/berubah
+        affected_months: list bulan 'YYYY-MM' (berubah + dihapus)
+        drop_mask: boolean array tambahan untuk membatasi baris yang diganti
+            (misal hanya baris Realisasi); None berarti semua baris bulan tsb
+    """
+    affected = previous_df['tanggal'].dt.strftime('%Y-%m').isin(affected_months).to_numpy()
+    if drop_mask is not None:
+        affected &= drop_mask
+    return pd.concat([previous_df[~affected], new_rows], ignore_index=True)
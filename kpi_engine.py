@@ -0,0 +1,95 @@
+from functools import lru_cache
+
+import pandas as pd
+import numpy as np
+
+
+def _pct_change(current, previous):
+    """Perubahan persen (0 jika nilai pembanding 0, seperti kartu KPI lama)"""
+    return 0 if previous == 0 else ((current - previous) / previous) * 100
+
+
+class KpiEngine:
+    """
+    Hitung semua seri bulanan untuk halaman Ringkasan Eksekutif dalam satu pass.
+
+    Window saat ini dan window tahun lalu diambil dari satu slice cube (tile
+    terpilih x bulan dari awal window tahun lalu sampai akhir window saat
+    ini), direduksi sekali per sumber, lalu dipecah per window. Hasil
+    di-memoize berdasarkan (area terurut, start, end).
+    """
+
+    def __init__(self, cube, maxsize=128):
+        self.cube = cube
+        self._summary = lru_cache(maxsize=maxsize)(self._compute)
+
+    def summary(self, areas, start, end):
+        """
+        Ringkasan KPI untuk filter sidebar.
+
+        Returns:
+            dict berisi monthly_totals, prev_monthly_totals, total/prev_total,
+            avg/prev_avg, yoy_change/yoy_avg_change, peak_month/peak_value,
+            monthly_historical dan monthly_forecast (DataFrame untuk grafik)
+        """
+        areas_key = tuple(sorted(areas)) if areas else ()
+        return self._summary(areas_key, pd.Timestamp(start), pd.Timestamp(end))
+
+    def _compute(self, areas_key, start, end):
+        cube = self.cube
+        prev_start = start - pd.DateOffset(years=1)
+        prev_end = end - pd.DateOffset(years=1)
+
+        # Satu slice yang mencakup kedua window
+        window = cube.month_slice(min(prev_start, start), max(prev_end, end))
+        tiles = cube.tile_positions(areas_key)
+        months = cube.months[window]
+
+        present = cube.present[:, :, window][:, tiles]
+        hotspot_sum = cube.hotspots[:, :, window][:, tiles].sum(axis=1)     # sumber x bulan
+        rainfall_sum = cube.rainfall[:, :, window][:, tiles].sum(axis=1)
+        cell_count = present.sum(axis=1)
+
+        def window_mask(lo, hi):
+            return (months >= np.datetime64(lo)) & (months <= np.datetime64(hi))
+
+        def totals(mask):
+            has_data = mask & (cell_count.sum(axis=0) > 0)
+            return pd.Series(
+                hotspot_sum.sum(axis=0)[has_data],
+                index=pd.DatetimeIndex(months[has_data]),
+                name='titik_panas'
+            )
+
+        def source_frame(source, mask):
+            s = cube.sources.index(source)
+            has_data = mask & (cell_count[s] > 0)
+            return pd.DataFrame({
+                'tanggal': pd.DatetimeIndex(months[has_data]),
+                'titik_panas': hotspot_sum[s][has_data],
+                'curah_hujan': rainfall_sum[s][has_data] / cell_count[s][has_data]
+            })
+
+        current = window_mask(start, end)
+        monthly_totals = totals(current)
+        prev_monthly_totals = totals(window_mask(prev_start, prev_end))
+
+        total = monthly_totals.sum()
+        prev_total = prev_monthly_totals.sum()
+        avg = monthly_totals.mean()
+        prev_avg = prev_monthly_totals.mean()
+
+        return {
+            'monthly_totals': monthly_totals,
+            'prev_monthly_totals': prev_monthly_totals,
+            'total': total,
+            'prev_total': prev_total,
+            'yoy_change': _pct_change(total, prev_total),
+            'avg': avg,
+            'prev_avg': prev_avg,
+            'yoy_avg_change': _pct_change(avg, prev_avg),
+            'peak_month': monthly_totals.idxmax() if len(monthly_totals) > 0 else None,
+            'peak_value': monthly_totals.max() if len(monthly_totals) > 0 else 0,
+            'monthly_historical': source_frame('Realisasi', current),
+            'monthly_forecast': source_frame('Prakiran', current),
+        }
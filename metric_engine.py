@@ -0,0 +1,172 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import numpy as np
+
+from quartile_thresholds import CATEGORY_LABELS, category_codes
+
+# Metrik yang dihitung per tile, per bulan dan keseluruhan
+METRICS = ('mape', 'mae', 'rmse', 'bias', 'hit_rate')
+
+
+def model_hash(values):
+    """Hash isi array forecast (dipakai sebagai key cache hasil metrik)"""
+    values = np.ascontiguousarray(values, dtype=float)
+    digest = hashlib.sha256(repr(values.shape).encode())
+    digest.update(values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _masked_mean(values, valid, axis):
+    """Rata-rata hanya atas sel valid (NaN jika tidak ada sel valid)"""
+    count = valid.sum(axis=axis)
+    total = np.where(valid, values, 0.0).sum(axis=axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+class MetricEngine:
+    """
+    Skor banyak model forecast terhadap data aktual sekaligus.
+
+    Forecast disusun sebagai array model x tile x bulan pada indeks yang sama
+    dengan data aktual, lalu semua error dihitung sebagai operasi array (tanpa
+    pd.merge per model). Sel dianggap valid jika nilai aktual dan prediksi
+    sama-sama ada (setara inner join lama).
+
+    MAPE memakai "safe MAPE" seperti dashboard: |aktual - prediksi| / max(aktual, 1).
+    Hit-rate kategori membandingkan kategori kuartil prediksi vs aktual
+    (butuh threshold kuartil per tile). Hasil per model di-cache berdasarkan
+    hash isi forecast dan subset tile.
+    """
+
+    def __init__(self, actual, tile_ids, months, quartiles=None, maxsize=256):
+        self.actual = np.asarray(actual, dtype=float)      # tile x bulan
+        self.tile_ids = np.asarray(tile_ids)
+        self.months = pd.DatetimeIndex(months)
+        self.quartiles = quartiles
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.actual_labels = None
+        if quartiles is not None:
+            self.actual_labels = CATEGORY_LABELS[category_codes(self.actual.T, quartiles)].T
+
+    @classmethod
+    def from_validation(cls, validation_df, tile_ids, months, quartiles=None, **kwargs):
+        """Bangun engine dari data aktual long-format (tanggal, tile_id, titik_panas_aktual)"""
+        actual = validation_df.pivot_table(
+            index='tile_id', columns='tanggal', values='titik_panas_aktual', aggfunc='last'
+        )
+        actual = actual.reindex(index=tile_ids, columns=pd.DatetimeIndex(months))
+        return cls(actual.to_numpy(dtype=float), tile_ids, months, quartiles, **kwargs)
+
+    def tile_positions(self, tiles):
+        """Posisi tile untuk daftar tile id (None berarti semua tile)"""
+        if tiles is None:
+            return np.arange(len(self.tile_ids))
+        return np.flatnonzero(np.isin(self.tile_ids, list(tiles)))
+
+    def score(self, forecasts, tiles=None):
+        """
+        Hitung semua metrik untuk batch forecast.
+
+        Args:
+            forecasts: array (n_models, n_tiles, n_months) pada indeks engine
+            tiles: subset tile id (None berarti semua tile)
+
+        Returns:
+            dict berisi 'overall' (metrik -> array n_models), 'per_tile'
+            (metrik -> n_models x n_tiles), 'per_month' (metrik -> n_models x
+            n_months), serta 'monthly_pred'/'monthly_actual'/'month_has_data'
+            (total per bulan atas sel valid). Tile di luar subset bernilai NaN
+            pada 'per_tile'.
+        """
+        pred = np.asarray(forecasts, dtype=float)
+        in_subset = np.zeros(len(self.tile_ids), dtype=bool)
+        in_subset[self.tile_positions(tiles)] = True
+
+        actual = self.actual[np.newaxis]
+        valid = ~np.isnan(actual) & ~np.isnan(pred) & in_subset[np.newaxis, :, np.newaxis]
+        error = np.where(valid, pred - actual, 0.0)
+
+        cell_metrics = {
+            'mape': np.abs(error) / np.maximum(np.nan_to_num(actual), 1) * 100,
+            'mae': np.abs(error),
+            'rmse': error ** 2,
+            'bias': error,
+        }
+        if self.actual_labels is not None:
+            pred_labels = CATEGORY_LABELS[category_codes(pred.transpose(0, 2, 1), self.quartiles)]
+            cell_metrics['hit_rate'] = (pred_labels.transpose(0, 2, 1) == self.actual_labels) * 100.0
+        else:
+            cell_metrics['hit_rate'] = np.full(pred.shape, np.nan)
+
+        result = {'overall': {}, 'per_tile': {}, 'per_month': {}}
+        for name, values in cell_metrics.items():
+            result['overall'][name] = _masked_mean(values, valid, axis=(1, 2))
+            result['per_tile'][name] = _masked_mean(values, valid, axis=2)
+            result['per_month'][name] = _masked_mean(values, valid, axis=1)
+        for scope in result.values():
+            scope['rmse'] = np.sqrt(scope['rmse'])
+
+        result['monthly_pred'] = np.where(valid, pred, 0.0).sum(axis=1)
+        result['monthly_actual'] = np.where(valid, actual, 0.0).sum(axis=1)
+        result['month_has_data'] = valid.any(axis=1)
+        return result
+
+    def evaluate(self, models, tiles=None):
+        """
+        Skor model-model bernama, memakai cache hasil per hash forecast.
+
+        Args:
+            models: dict nama -> array (n_tiles, n_months) pada indeks engine
+            tiles: subset tile id (None berarti semua tile)
+
+        Returns:
+            dict nama -> hasil score() untuk satu model (tanpa sumbu model)
+        """
+        tiles_key = None if tiles is None else tuple(sorted(tiles))
+        keys = {name: (model_hash(values), tiles_key) for name, values in models.items()}
+
+        results = {}
+        with self._lock:
+            for name, key in keys.items():
+                if key in self._results:
+                    self._results.move_to_end(key)
+                    results[name] = self._results[key]
+        pending = [name for name in models if name not in results]
+
+        if pending:
+            # Satu batch array untuk semua model yang belum ada di cache
+            batch = self.score(np.stack([models[name] for name in pending]), tiles)
+            with self._lock:
+                for i, name in enumerate(pending):
+                    results[name] = _take_model(batch, i)
+                    self._results[keys[name]] = results[name]
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        return {name: results[name] for name in models}
+
+    def leaderboard(self, models, tiles=None):
+        """Tabel metrik keseluruhan per model, diurutkan dari MAPE terkecil"""
+        results = self.evaluate(models, tiles)
+        table = pd.DataFrame(
+            {metric: [results[name]['overall'][metric] for name in models] for metric in METRICS},
+            index=pd.Index(list(models), name='model')
+        )
+        return table.sort_values('mape', kind='stable')
+
+
+def _take_model(batch, i):
+    """Ambil hasil satu model dari hasil batch score()"""
+    single = {}
+    for key, value in batch.items():
+        if isinstance(value, dict):
+            single[key] = {metric: arr[i] for metric, arr in value.items()}
+        else:
+            single[key] = value[i]
+    return single
@@ -0,0 +1,174 @@
+# Ingest streaming data titik panas mentah (format FIRMS: latitude, longitude,
+# acq_date per titik) menjadi jumlah titik panas tile x bulan dengan format
+# monthly_hotspot_sum.csv. File dibaca per chunk; setiap chunk dipetakan ke tile
+# dengan lookup grid (TileIndex.locate) lalu ditambahkan ke array hitungan
+# bulan x tile, sehingga memori tidak bergantung pada ukuran file mentah.
+# Dengan --daily hitungan dibuat per hari (store harian, lihat daily_store.py)
+# dan hasil bulanan diturunkan dari resampling array harian tersebut.
+#
+# Contoh:
+#   python point_ingest.py fire_archive_*.csv -o monthly_hotspot_points.csv
+#   python point_ingest.py fire_nrt.csv.gz --update monthly_hotspot_sum.csv
+#   python point_ingest.py fire_archive_*.csv --daily daily_hotspot_counts.npy
+import argparse
+
+import pandas as pd
+import numpy as np
+
+from daily_store import DailyHotspotStore
+from data_pipeline import SOURCE_FILES, tile_columns
+from incremental_ingest import month_keys
+from tile_geometry import TileIndex
+
+DEFAULT_CHUNKSIZE = 500_000
+
+# Nama kolom default file FIRMS (MODIS/VIIRS)
+LAT_COLUMN = 'latitude'
+LON_COLUMN = 'longitude'
+DATE_COLUMN = 'acq_date'
+
+
+class TileMonthCounter:
+    """
+    Akumulator jumlah titik panas tile x bulan (unit='M') atau tile x hari (unit='D').
+
+    Array hitungan diindeks ordinal periode relatif terhadap periode pertama yang
+    pernah dilihat dan hanya diperbesar jika muncul periode di luar rentang, jadi
+    memori sebanding dengan jumlah periode x tile, bukan jumlah titik.
+    """
+
+    def __init__(self, tile_index, unit='M'):
+        if unit not in ('M', 'D'):
+            raise ValueError(f"Unit tidak didukung: {unit}")
+        self.tile_index = tile_index
+        self.unit = unit
+        self.counts = np.zeros((0, len(tile_index)), dtype=np.int64)
+        self.first_ordinal = None
+        self.points_seen = 0
+        self.points_outside = 0
+
+    def _ensure_range(self, lo, hi):
+        """Perbesar array agar mencakup ordinal periode [lo, hi]"""
+        if self.first_ordinal is None:
+            self.first_ordinal = lo
+        start = min(lo, self.first_ordinal)
+        end = max(hi, self.first_ordinal + len(self.counts) - 1)
+        if start == self.first_ordinal and end - start + 1 == len(self.counts):
+            return
+        grown = np.zeros((end - start + 1, self.counts.shape[1]), dtype=np.int64)
+        offset = self.first_ordinal - start
+        grown[offset:offset + len(self.counts)] = self.counts
+        self.counts = grown
+        self.first_ordinal = start
+
+    def add(self, lat, lon, dates):
+        """Tambahkan satu chunk titik (array lat, lon, tanggal)"""
+        tile_pos = self.tile_index.locate(lat, lon)
+        # Ordinal periode sejak 1970-01(-01) (NaT untuk tanggal tidak valid)
+        periods = pd.to_datetime(dates, errors='coerce').to_numpy().astype(f'datetime64[{self.unit}]')
+        ordinal = periods.astype(np.int64)
+        valid = (tile_pos >= 0) & ~np.isnat(periods)
+        self.points_seen += len(tile_pos)
+        self.points_outside += int((~valid).sum())
+        if not valid.any():
+            return
+
+        ordinal = ordinal[valid]
+        self._ensure_range(int(ordinal.min()), int(ordinal.max()))
+        n_tiles = self.counts.shape[1]
+        flat = (ordinal - self.first_ordinal) * n_tiles + tile_pos[valid]
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+
+    def to_frame(self):
+        """Hasil dalam format wide monthly_hotspot_sum.csv (year_month, tile_1, ...)"""
+        if self.unit == 'D':
+            return self.to_daily_store().to_monthly_frame()
+        n_months = len(self.counts)
+        if n_months == 0:
+            return pd.DataFrame(columns=['year_month'] + tile_columns(self.tile_index.ids))
+        start = pd.Timestamp(np.datetime64(self.first_ordinal, 'M'))
+        months = pd.date_range(start, periods=n_months, freq='MS')
+        frame = pd.DataFrame(self.counts, columns=tile_columns(self.tile_index.ids))
+        frame.insert(0, 'year_month', months.strftime('%Y-%m'))
+        return frame
+
+    def to_daily_store(self):
+        """Hasil hitungan harian sebagai DailyHotspotStore (hanya unit='D')"""
+        if self.unit != 'D':
+            raise ValueError("to_daily_store membutuhkan counter dengan unit='D'")
+        start = np.datetime64(self.first_ordinal or 0, 'D')
+        return DailyHotspotStore.from_counts(self.counts, start, self.tile_index.ids)
+
+
+def ingest_points(paths, tile_index, chunksize=DEFAULT_CHUNKSIZE, lat_column=LAT_COLUMN,
+                  lon_column=LON_COLUMN, date_column=DATE_COLUMN, unit='M'):
+    """
+    Baca file titik panas mentah per chunk dan hitung jumlah per tile x bulan
+    (atau per tile x hari jika unit='D').
+
+    Returns:
+        TileMonthCounter berisi hasil akumulasi
+    """
+    counter = TileMonthCounter(tile_index, unit)
+    for path in paths:
+        reader = pd.read_csv(path, usecols=[lat_column, lon_column, date_column],
+                             chunksize=chunksize)
+        for chunk in reader:
+            counter.add(
+                chunk[lat_column].to_numpy(dtype=float),
+                chunk[lon_column].to_numpy(dtype=float),
+                chunk[date_column].to_numpy()
+            )
+    return counter
+
+
+def update_monthly_file(existing_df, new_df):
+    """
+    Gabungkan hasil ingest ke data bulanan lama: bulan yang ada di new_df
+    menggantikan baris lama, bulan lain tetap.
+    """
+    keep = ~month_keys(existing_df['year_month']).isin(month_keys(new_df['year_month'])).to_numpy()
+    merged = pd.concat([existing_df[keep], new_df[existing_df.columns]], ignore_index=True)
+    order = np.argsort(pd.to_datetime(merged['year_month']).to_numpy(), kind='stable')
+    return merged.iloc[order].reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ingest titik panas mentah ke jumlah tile x bulan')
+    parser.add_argument('files', nargs='+', help='File titik panas mentah (CSV, boleh .gz)')
+    parser.add_argument('-o', '--output', default=None, help='File output format monthly_hotspot_sum.csv')
+    parser.add_argument('--update', default=None,
+                        help='Perbarui bulan yang ada di file bulanan ini (mis. monthly_hotspot_sum.csv)')
+    parser.add_argument('--daily', default=None,
+                        help='Simpan juga store harian tile x hari (mis. daily_hotspot_counts.npy)')
+    parser.add_argument('--tiles', default=SOURCE_FILES['tiles'], help='File batas tile')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument('--lat-column', default=LAT_COLUMN)
+    parser.add_argument('--lon-column', default=LON_COLUMN)
+    parser.add_argument('--date-column', default=DATE_COLUMN)
+    args = parser.parse_args(argv)
+
+    counter = ingest_points(
+        args.files, TileIndex.from_csv(args.tiles), args.chunksize,
+        args.lat_column, args.lon_column, args.date_column, unit='D' if args.daily else 'M'
+    )
+    if args.daily:
+        store = counter.to_daily_store()
+        store.save(args.daily)
+        print(f"Store harian disimpan: {args.daily} ({len(store)} hari)")
+    result = counter.to_frame()
+    print(f"{counter.points_seen:,} titik dibaca, {counter.points_outside:,} di luar tile/tanggal tidak valid")
+    print(f"{len(result)} bulan, {int(counter.counts.sum()):,} titik panas di dalam tile")
+
+    if args.update:
+        result = update_monthly_file(pd.read_csv(args.update), result)
+        result.to_csv(args.update, index=False)
+        print(f"Diperbarui: {args.update}")
+    if args.output:
+        result.to_csv(args.output, index=False)
+        print(f"Disimpan: {args.output}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Threshold kuartil per tile dan kategorisasi Low/Medium/High untuk matriks
+# bulan x tile. Dipakai oleh pipeline dashboard (data_pipeline.py, dataset_cache.py)
+# dan oleh script di folder "untuk ngecek statistik".
+import warnings
+
+import numpy as np
+
+# Kuartil yang dipakai sebagai batas kategori
+QUARTILES = (0.25, 0.50, 0.75)
+
+# Label untuk kode hasil categorize_matrix (jumlah batas yang dilewati nilai)
+CATEGORY_LABELS = np.array(['Low', 'Medium', 'High', 'High'], dtype=object)
+
+
+def compute_quartile_thresholds(values):
+    """
+    Hitung Q25/Q50/Q75 per tile sekaligus untuk matriks bulan x tile.
+
+    Nilai <= 0 (tidak ada aktivitas) di-mask sebelum dihitung, sehingga
+    kuartil hanya memakai nilai non-zero. Tile tanpa aktivitas mendapat
+    threshold 0.
+
+    Returns:
+        array (3, n_tiles) berisi Q25, Q50, Q75
+    """
+    values = np.asarray(values, dtype=float)
+    masked = np.where(values > 0, values, np.nan)
+    with warnings.catch_warnings():
+        # Tile tanpa nilai non-zero menghasilkan "All-NaN slice"
+        warnings.simplefilter('ignore', RuntimeWarning)
+        quartiles = np.nanquantile(masked, QUARTILES, axis=0)
+    return np.nan_to_num(quartiles, nan=0.0)
+
+
+def category_codes(values, quartiles):
+    """
+    Kode kategori (0..3) untuk seluruh matriks bulan x tile sekaligus.
+
+    Setara dengan np.digitize per tile (batas kanan inklusif): kode = jumlah
+    threshold tile yang lebih kecil dari nilai.
+
+    Args:
+        values: array (n_months, n_tiles)
+        quartiles: array (3, n_tiles) dari compute_quartile_thresholds
+    """
+    values = np.asarray(values, dtype=float)
+    codes = (values[..., np.newaxis] > quartiles.T[np.newaxis]).sum(axis=-1)
+    # NaN tidak lolos perbandingan apa pun pada versi skalar -> 'High'
+    codes[np.isnan(values)] = len(QUARTILES)
+    return codes
+
+
+def categorize_matrix(values, quartiles):
+    """
+    Kategorikan seluruh matriks bulan x tile sekaligus.
+
+    Returns:
+        array object (n_months, n_tiles) berisi 'Low'/'Medium'/'High'
+    """
+    return CATEGORY_LABELS[category_codes(values, quartiles)]
+
+
+def thresholds_to_dict(tile_columns, quartiles):
+    """Ubah array kuartil (3, n_tiles) menjadi dict per tile seperti format JSON"""
+    return {
+        tile: {'q25': float(q25), 'q50': float(q50), 'q75': float(q75)}
+        for tile, q25, q50, q75 in zip(tile_columns, *quartiles)
+    }
+
+
+def thresholds_to_array(thresholds, tile_columns):
+    """Ubah dict threshold per tile menjadi array (3, n_tiles)"""
+    return np.array([
+        [thresholds[tile][key] for tile in tile_columns] for key in ('q25', 'q50', 'q75')
+    ], dtype=float)
@@ -0,0 +1,128 @@
+import pandas as pd
+import numpy as np
+
+from data_pipeline import REGION_NAMES, RISK_LEVELS, region_code
+
+
+class RegionRollup:
+    """
+    Rollup blok kecamatan (SK/TP/SR/BA/KB) x bulan yang dihitung sekali dari cube.
+
+    Keanggotaan tile disimpan sebagai matriks blok x tile, sehingga semua
+    rollup (total titik panas, kepadatan per km², jumlah tile per tingkat
+    risiko) didapat dari satu perkalian matriks per array cube. View
+    drill-down cukup membaca slice bulan dari array ini.
+
+    Bulan 2025 punya baris Realisasi dan Prakiran sekaligus; total tidak pernah
+    dijumlahkan lintas sumber. Default-nya tiap bulan memakai satu sumber:
+    Realisasi jika ada, selain itu Prakiran (lihat month_source).
+    """
+
+    def __init__(self, cube, tile_index):
+        codes = region_code(cube.tile_areas)
+        self.regions = [code for code in REGION_NAMES if code in set(codes)]
+        self.region_names = [REGION_NAMES[code] for code in self.regions]
+        self.months = cube.months
+        self.sources = list(cube.sources)
+        self.tile_ids = cube.tile_ids
+        self.tile_areas = cube.tile_areas
+        self.tile_region = codes
+
+        # Matriks keanggotaan blok x tile
+        self.membership = (np.asarray(self.regions, dtype=object)[:, np.newaxis] == codes).astype(float)
+        tile_km2 = tile_index.area_km2[tile_index.positions(cube.tile_ids)]
+        self.area_km2 = self.membership @ tile_km2
+
+        # sumber x blok x bulan
+        self.hotspots = np.einsum('rt,stm->srm', self.membership, cube.hotspots)
+        self.tile_count = np.einsum('rt,stm->srm', self.membership, cube.present.astype(float))
+        self.density = self.hotspots / self.area_km2[np.newaxis, :, np.newaxis]
+
+        # sumber x blok x bulan x tingkat risiko (jumlah tile)
+        levels = np.arange(len(RISK_LEVELS), dtype=np.int8)
+        one_hot = (cube.risk_code[..., np.newaxis] == levels).astype(float)
+        self.risk_counts = np.einsum('rt,stml->srml', self.membership, one_hot)
+
+        # Sumber default per bulan: sumber pertama (Realisasi) yang punya data
+        self.month_source = np.argmax(cube.present.any(axis=1), axis=0)
+
+        # Tetap disimpan untuk drill-down per tile di dalam blok
+        self._cube = cube
+
+        for arr in (self.hotspots, self.tile_count, self.density, self.risk_counts):
+            arr.flags.writeable = False
+
+    def region_position(self, region):
+        return self.regions.index(region)
+
+    def month_sources(self, start, end, source=None):
+        """
+        Posisi bulan dan posisi sumber per bulan untuk rentang [start, end].
+
+        source=None memakai month_source (Realisasi lebih dulu dari Prakiran).
+        """
+        window = self._cube.month_slice(start, end)
+        months = np.arange(len(self.months))[window]
+        if source is None:
+            return months, self.month_source[months]
+        return months, np.full(len(months), self.sources.index(source))
+
+    def summary(self, start, end, source=None):
+        """
+        Ringkasan per blok untuk rentang bulan (satu sumber per bulan, lihat month_sources).
+
+        Returns:
+            DataFrame kolom region, nama, luas, total titik panas, kepadatan dan
+            jumlah sel tile x bulan per tingkat risiko
+        """
+        months, sources = self.month_sources(start, end, source)
+        # Indeks (sumber, bulan) berpasangan -> array bulan x blok (x tingkat risiko)
+        hotspots = self.hotspots[sources, :, months].sum(axis=0)
+        risk = self.risk_counts[sources, :, months].sum(axis=0)
+        summary = pd.DataFrame({
+            'region': self.regions,
+            'nama': self.region_names,
+            'area_km2': self.area_km2,
+            'titik_panas': hotspots,
+            'kepadatan_per_100km2': hotspots / self.area_km2 * 100,
+        })
+        for i, level in enumerate(RISK_LEVELS):
+            summary[level] = risk[:, i].astype(int)
+        return summary
+
+    def monthly(self, region, start, end):
+        """
+        Seri bulanan satu blok per sumber data (hanya bulan yang punya data).
+
+        Bulan 2025 muncul dua kali (Realisasi dan Prakiran), jadi baris hasil
+        tidak boleh dijumlahkan lintas sumber; pakai summary() untuk total.
+
+        Returns:
+            DataFrame kolom tanggal, sumber_data, titik_panas, kepadatan dan
+            jumlah tile per tingkat risiko
+        """
+        r = self.region_position(region)
+        window = self._cube.month_slice(start, end)
+        months = self.months[window]
+        frames = []
+        for s, source in enumerate(self.sources):
+            has_data = self.tile_count[s, r, window] > 0
+            frame = pd.DataFrame({
+                'tanggal': pd.DatetimeIndex(months[has_data]),
+                'sumber_data': source,
+                'titik_panas': self.hotspots[s, r, window][has_data],
+                'kepadatan_per_100km2': self.density[s, r, window][has_data] * 100,
+            })
+            for i, level in enumerate(RISK_LEVELS):
+                frame[level] = self.risk_counts[s, r, window, i][has_data].astype(int)
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True).sort_values('tanggal', kind='stable')
+
+    def tiles(self, region, start, end, source=None):
+        """Total titik panas per tile di dalam satu blok (satu sumber per bulan)"""
+        tiles = np.flatnonzero(self.tile_region == region)
+        months, sources = self.month_sources(start, end, source)
+        return pd.DataFrame({
+            'Lokasi': self.tile_areas[tiles],
+            'Total Titik Panas': self._cube.hotspots[sources, :, months][:, tiles].sum(axis=0),
+        })
@@ -0,0 +1,76 @@
+import numpy as np
+from scipy import sparse
+
+# Offset tetangga (queen contiguity): 8 sel di sekitar posisi grid
+QUEEN_OFFSETS = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)]
+ROOK_OFFSETS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+class TileAdjacency:
+    """
+    Matriks ketetanggaan sparse antar tile dari grid_position_i/j.
+
+    Dibangun sekali: posisi grid dipetakan ke tabel padat, lalu tetangga untuk
+    setiap offset dicari sebagai lookup array (tanpa loop jarak per pasangan
+    tile). Fitur spasial untuk semua bulan dihitung dengan satu perkalian
+    matriks sparse x array tile x bulan.
+    """
+
+    def __init__(self, tile_index, offsets=QUEEN_OFFSETS):
+        self.tile_ids = tile_index.ids
+        grid_i = tile_index.grid_i - tile_index.grid_i.min()
+        grid_j = tile_index.grid_j - tile_index.grid_j.min()
+
+        # Tabel grid -> posisi tile (-1 untuk sel kosong), diberi bingkai 1 sel
+        lookup = np.full((grid_i.max() + 3, grid_j.max() + 3), -1, dtype=np.int64)
+        lookup[grid_i + 1, grid_j + 1] = np.arange(len(self.tile_ids))
+
+        rows, cols = [], []
+        for di, dj in offsets:
+            neighbour = lookup[grid_i + 1 + di, grid_j + 1 + dj]
+            has_neighbour = neighbour >= 0
+            rows.append(np.flatnonzero(has_neighbour))
+            cols.append(neighbour[has_neighbour])
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+
+        n = len(self.tile_ids)
+        self.matrix = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+        self.degree = np.asarray(self.matrix.sum(axis=1)).ravel()
+        # Bobot baris ternormalisasi (rata-rata tetangga) untuk spatial lag
+        inv_degree = np.divide(1.0, self.degree, out=np.zeros(n), where=self.degree > 0)
+        self.weights = sparse.diags(inv_degree) @ self.matrix
+
+    def neighbour_sum(self, values):
+        """Jumlah nilai tetangga; values berbentuk (n_tiles, ...) dengan sumbu tile di depan"""
+        return self._apply(self.matrix, values)
+
+    def spatial_lag(self, values):
+        """Rata-rata nilai tetangga (spatial lag dengan bobot baris ternormalisasi)"""
+        return self._apply(self.weights, values)
+
+    @staticmethod
+    def _apply(matrix, values):
+        values = np.asarray(values, dtype=float)
+        flat = values.reshape(values.shape[0], -1)
+        return np.asarray(matrix @ flat).reshape(values.shape)
+
+
+def spatial_features(adjacency, hotspots):
+    """
+    Fitur spasial titik panas untuk semua bulan sekaligus.
+
+    Args:
+        hotspots: array (n_tiles, ...) jumlah titik panas, sumbu tile di depan
+
+    Returns:
+        dict berisi neighbour_sum, spatial_lag dan cluster (tile dengan titik
+        panas yang juga punya tetangga dengan titik panas)
+    """
+    hotspots = np.asarray(hotspots, dtype=float)
+    neighbour_sum = adjacency.neighbour_sum(hotspots)
+    return {
+        'neighbour_sum': neighbour_sum,
+        'spatial_lag': adjacency.spatial_lag(hotspots),
+        'cluster': (hotspots > 0) & (neighbour_sum > 0),
+    }
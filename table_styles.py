@@ -0,0 +1,34 @@
+import pandas as pd
+import numpy as np
+
+# CSS sel tabel (hijau = rendah/terendah, kuning = sedang, merah = tinggi/tertinggi)
+STYLE_LOW = 'background-color: #d4edda; color: #155724; font-weight: bold'
+STYLE_MEDIUM = 'background-color: #fff3cd; color: #856404; font-weight: bold'
+STYLE_HIGH = 'background-color: #f8d7da; color: #721c24; font-weight: bold'
+
+CATEGORY_STYLES = {'Tinggi': STYLE_HIGH, 'Sangat Tinggi': STYLE_HIGH, 'Sedang': STYLE_MEDIUM}
+
+
+def highlight_matrix(df, value_column=None, category_column=None, min_val=None, max_val=None):
+    """
+    Matriks CSS (bentuk sama dengan df) untuk Styler.apply(..., axis=None).
+
+    - value_column: nilai == min_val hijau, == max_val merah
+    - category_column: Tinggi/Sangat Tinggi merah, Sedang kuning, lainnya hijau
+
+    Dihitung sebagai operasi kolom (np.where/map), tanpa callback per baris.
+    """
+    styles = pd.DataFrame('', index=df.index, columns=df.columns)
+    if value_column is not None:
+        values = df[value_column].to_numpy()
+        styles[value_column] = np.where(
+            values == min_val, STYLE_LOW, np.where(values == max_val, STYLE_HIGH, '')
+        )
+    if category_column is not None:
+        styles[category_column] = df[category_column].astype(object).map(CATEGORY_STYLES).fillna(STYLE_LOW).to_numpy()
+    return styles
+
+
+def style_table(df, styles):
+    """Styler dengan matriks CSS yang sudah dihitung (satu panggilan untuk seluruh tabel)"""
+    return df.style.apply(lambda _: styles, axis=None)
@@ -0,0 +1,142 @@
+import pandas as pd
+import numpy as np
+
+
+class TileIndex:
+    """
+    Indeks geometri tile yang dibangun sekali dari pontianak_tile_boundaries.csv.
+
+    Semua atribut disimpan sebagai array NumPy kontigu dengan urutan tile id
+    (ascending). Lookup tile id -> posisi array memakai tabel padat sehingga
+    berlaku O(1) baik untuk satu id maupun array id.
+    """
+
+    def __init__(self, tiles_df):
+        tiles = tiles_df.sort_values('id')
+        self.ids = np.ascontiguousarray(tiles['id'].to_numpy(dtype=np.int64))
+
+        # Sudut tile berurutan sebagai ring poligon: kiri atas, kanan atas, kanan bawah, kiri bawah
+        lat_corners = tiles[['lat_top_left', 'lat_top_right',
+                             'lat_bottom_right', 'lat_bottom_left']].to_numpy(dtype=float)
+        lon_corners = tiles[['lon_top_left', 'lon_top_right',
+                             'lon_bottom_right', 'lon_bottom_left']].to_numpy(dtype=float)
+        self.corner_lat = np.ascontiguousarray(lat_corners)
+        self.corner_lon = np.ascontiguousarray(lon_corners)
+
+        # Bounds (min/max) dan centroid tiap tile
+        self.lat_min = np.ascontiguousarray(lat_corners.min(axis=1))
+        self.lat_max = np.ascontiguousarray(lat_corners.max(axis=1))
+        self.lon_min = np.ascontiguousarray(lon_corners.min(axis=1))
+        self.lon_max = np.ascontiguousarray(lon_corners.max(axis=1))
+        self.center_lat = (self.lat_min + self.lat_max) / 2
+        self.center_lon = (self.lon_min + self.lon_max) / 2
+
+        self.area_km2 = np.ascontiguousarray(tiles['area_km2'].to_numpy(dtype=float))
+        self.grid_i = np.ascontiguousarray(tiles['grid_position_i'].to_numpy(dtype=np.int64))
+        self.grid_j = np.ascontiguousarray(tiles['grid_position_j'].to_numpy(dtype=np.int64))
+
+        # Tabel lookup id -> posisi (-1 jika id tidak ada)
+        self._position = np.full(self.ids.max() + 1, -1, dtype=np.int64)
+        self._position[self.ids] = np.arange(len(self.ids))
+
+        # Grid sel dari semua tepi tile (lat/lon) untuk lookup titik -> tile
+        self._lat_edges = np.unique(np.concatenate([self.lat_min, self.lat_max]))
+        self._lon_edges = np.unique(np.concatenate([self.lon_min, self.lon_max]))
+        self._cell_tile = np.full((len(self._lat_edges) - 1, len(self._lon_edges) - 1), -1, dtype=np.int64)
+        row_lo = np.searchsorted(self._lat_edges, self.lat_min)
+        row_hi = np.searchsorted(self._lat_edges, self.lat_max)
+        col_lo = np.searchsorted(self._lon_edges, self.lon_min)
+        col_hi = np.searchsorted(self._lon_edges, self.lon_max)
+        for pos in range(len(self.ids)):
+            self._cell_tile[row_lo[pos]:row_hi[pos], col_lo[pos]:col_hi[pos]] = pos
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_csv(cls, path='pontianak_tile_boundaries.csv'):
+        """Bangun indeks langsung dari file CSV batas tile"""
+        return cls(pd.read_csv(path))
+
+    def positions(self, tile_ids):
+        """Posisi array untuk satu tile id atau array tile id"""
+        tile_ids = np.asarray(tile_ids)
+        valid = (tile_ids >= 0) & (tile_ids < len(self._position))
+        pos = np.where(valid, self._position[np.where(valid, tile_ids, 0)], -1)
+        if np.any(pos < 0):
+            missing = np.unique(np.asarray(tile_ids)[pos < 0])
+            raise KeyError(f"Tile id tidak dikenal: {missing.tolist()}")
+        return pos
+
+    def locate(self, lat, lon):
+        """
+        Posisi tile untuk array titik (lat, lon) sekaligus (-1 jika di luar semua tile).
+
+        Titik dipetakan ke sel grid tepi tile dengan searchsorted lalu ke tile
+        lewat tabel sel -> tile. Titik tepat di tepi bersama masuk ke tile
+        sebelah utara/timur; tepi luar utara/timur tetap dihitung masuk.
+        """
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        n_rows, n_cols = self._cell_tile.shape
+        row = np.searchsorted(self._lat_edges, lat, side='right') - 1
+        col = np.searchsorted(self._lon_edges, lon, side='right') - 1
+        # Titik tepat di tepi luar utara/timur masuk ke sel terakhir
+        row = np.where(lat == self._lat_edges[-1], n_rows - 1, row)
+        col = np.where(lon == self._lon_edges[-1], n_cols - 1, col)
+        inside = (row >= 0) & (row < n_rows) & (col >= 0) & (col < n_cols)
+        pos = np.full(lat.shape, -1, dtype=np.int64)
+        pos[inside] = self._cell_tile[row[inside], col[inside]]
+        return pos
+
+    def centroid(self, tile_id):
+        """Centroid (lat, lon) untuk satu tile"""
+        pos = self.positions(tile_id)
+        return self.center_lat[pos], self.center_lon[pos]
+
+    def bounds(self, tile_id):
+        """Bounds (lat_min, lat_max, lon_min, lon_max) untuk satu tile"""
+        pos = self.positions(tile_id)
+        return self.lat_min[pos], self.lat_max[pos], self.lon_min[pos], self.lon_max[pos]
+
+    def grid_position(self, tile_id):
+        """Posisi grid (grid_position_i, grid_position_j) untuk satu tile"""
+        pos = self.positions(tile_id)
+        return self.grid_i[pos], self.grid_j[pos]
+
+    def geojson(self):
+        """
+        FeatureCollection GeoJSON poligon tile (id feature = tile id).
+
+        Koordinat [lon, lat] dengan ring tertutup dari empat sudut tile.
+        """
+        ring_lon = np.concatenate([self.corner_lon, self.corner_lon[:, :1]], axis=1)
+        ring_lat = np.concatenate([self.corner_lat, self.corner_lat[:, :1]], axis=1)
+        rings = np.stack([ring_lon, ring_lat], axis=-1).tolist()
+        return {
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'id': int(tile_id),
+                    'properties': {'tile_id': int(tile_id)},
+                    'geometry': {'type': 'Polygon', 'coordinates': [ring]},
+                }
+                for tile_id, ring in zip(self.ids, rings)
+            ],
+        }
+
+    def to_frame(self):
+        """Ringkasan indeks sebagai DataFrame (satu baris per tile)"""
+        return pd.DataFrame({
+            'tile_id': self.ids,
+            'lat_min': self.lat_min,
+            'lat_max': self.lat_max,
+            'lon_min': self.lon_min,
+            'lon_max': self.lon_max,
+            'latitude': self.center_lat,
+            'longitude': self.center_lon,
+            'area_km2': self.area_km2,
+            'grid_position_i': self.grid_i,
+            'grid_position_j': self.grid_j,
+        })
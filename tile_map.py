@@ -0,0 +1,209 @@
+import copy
+
+import pandas as pd
+import numpy as np
+
+from data_pipeline import RISK_LEVELS
+
+# Warna tingkat risiko (sama seperti peta scatter lama), urutan = kode warna (RISK_LEVELS)
+RISK_COLORS = {
+    'Rendah': '#2ecc71',
+    'Sedang': '#f39c12',
+    'Tinggi': '#e74c3c',
+    'Sangat Tinggi': '#c0392b'
+}
+
+# Warna garis tepi tile yang termasuk klaster titik panas
+CLUSTER_LINE_COLOR = '#2c3e50'
+
+# Array per tile yang dihitung untuk setiap bulan
+MONTH_KEYS = ('z', 'hotspots', 'levels', 'neighbours', 'cluster')
+
+MAP_CENTER = {"lat": -0.35, "lon": 109.2}
+MAP_ZOOM = 8.5
+
+
+def _discrete_colorscale(levels, colors):
+    """Colorscale bertingkat: kode i (0..n-1) -> warna levels[i]"""
+    n = len(levels)
+    scale = []
+    for i, level in enumerate(levels):
+        scale.append([i / n, colors[level]])
+        scale.append([(i + 1) / n, colors[level]])
+    return scale
+
+
+class TileMapLayer:
+    """
+    Layer peta poligon tile (choropleth) yang dibangun sekali dari TileIndex.
+
+    GeoJSON dan layout disimpan sebagai dict figure dasar. Untuk setiap bulan
+    hanya array kompak (kode risiko, titik panas) yang dihitung lalu
+    dimasukkan ke salinan dangkal figure dasar, tanpa membangun ulang figure
+    Plotly dari DataFrame.
+    """
+
+    def __init__(self, tile_index, area_names):
+        self.tile_ids = tile_index.ids
+        self.area_names = np.asarray(area_names, dtype=object)   # urut sesuai tile_ids
+        self._level_codes = {level: i for i, level in enumerate(RISK_LEVELS)}
+        self._base_trace = {
+            'type': 'choroplethmapbox',
+            'geojson': tile_index.geojson(),
+            'locations': self.tile_ids.tolist(),
+            'colorscale': _discrete_colorscale(RISK_LEVELS, RISK_COLORS),
+            'zmin': -0.5,
+            'zmax': len(RISK_LEVELS) - 0.5,
+            'colorbar': {
+                'title': {'text': 'tingkat_risiko'},
+                'tickvals': list(range(len(RISK_LEVELS))),
+                'ticktext': RISK_LEVELS,
+            },
+            'hovertemplate': (
+                '<b>%{customdata[0]}</b><br>titik_panas=%{customdata[1]:.2f}'
+                '<br>tingkat_risiko=%{customdata[2]}'
+                '<br>titik_panas_tetangga=%{customdata[3]:.2f}'
+                '<br>klaster=%{customdata[4]}<extra></extra>'
+            ),
+        }
+        self._base_layout = {
+            'height': 700,
+            'mapbox': {
+                'style': 'open-street-map',
+                'zoom': MAP_ZOOM,
+                'center': MAP_CENTER,
+                'bearing': 0,
+                'pitch': 0,
+            },
+            'margin': {'l': 0, 'r': 0, 't': 50, 'b': 0},
+        }
+
+    def month_matrix(self, map_data):
+        """
+        Array kompak bulan x tile untuk semua bulan di map_data sekaligus.
+
+        Tile tanpa baris di map_data (mis. di luar area terpilih) bernilai NaN
+        sehingga tidak diwarnai.
+
+        Returns:
+            dict berisi months, z (kode risiko), hotspots, levels, neighbours
+            (titik panas tile tetangga), cluster (flag klaster) dan musim
+            (musim per bulan, dari baris pertama bulan tersebut)
+        """
+        dates = map_data['tanggal'].to_numpy()
+        months, month_pos = np.unique(dates, return_inverse=True)
+        tile_pos = np.searchsorted(self.tile_ids, map_data['tile_id'].to_numpy())
+        shape = (len(months), len(self.tile_ids))
+
+        z = np.full(shape, np.nan)
+        hotspots = np.full(shape, np.nan)
+        levels = np.full(shape, '-', dtype=object)
+        neighbours = np.full(shape, np.nan)
+        cluster = np.zeros(shape, dtype=bool)
+        level_values = map_data['tingkat_risiko'].to_numpy()
+        codes = pd.Series(level_values).map(self._level_codes).to_numpy(dtype=float)
+
+        idx = (month_pos, tile_pos)
+        z[idx] = codes
+        hotspots[idx] = map_data['titik_panas'].to_numpy(dtype=float)
+        levels[idx] = level_values
+        neighbours[idx] = map_data['titik_panas_tetangga'].to_numpy(dtype=float)
+        cluster[idx] = map_data['klaster_titik_panas'].to_numpy(dtype=bool)
+
+        seasons = np.empty(len(months), dtype=object)
+        first_row = np.unique(month_pos, return_index=True)[1]
+        seasons[:] = map_data['musim'].to_numpy()[first_row]
+        return {'months': months, 'z': z, 'hotspots': hotspots, 'levels': levels,
+                'neighbours': neighbours, 'cluster': cluster, 'seasons': seasons}
+
+    def month_values(self, map_data):
+        """
+        Array kompak per tile untuk satu bulan data (urut sesuai tile_ids).
+
+        Returns:
+            dict berisi z (kode risiko), hotspots, levels, neighbours dan cluster
+        """
+        matrix = self.month_matrix(map_data)
+        if len(matrix['months']) == 0:
+            n = len(self.tile_ids)
+            return {'z': np.full(n, np.nan), 'hotspots': np.full(n, np.nan),
+                    'levels': np.full(n, '-', dtype=object),
+                    'neighbours': np.full(n, np.nan), 'cluster': np.zeros(n, dtype=bool)}
+        return {key: matrix[key][0] for key in MONTH_KEYS}
+
+    def trace(self, values):
+        """Trace choropleth dengan nilai bulan tertentu (GeoJSON dipakai bersama)"""
+        trace = dict(self._base_trace)
+        # NaN -> None agar tile tanpa data tidak diwarnai
+        trace['z'] = [None if np.isnan(v) else v for v in values['z']]
+        trace['customdata'] = np.column_stack([
+            self.area_names, np.round(values['hotspots'], 2), values['levels'],
+            np.round(values['neighbours'], 2), np.where(values['cluster'], 'Ya', 'Tidak')
+        ]).tolist()
+        # Tile klaster titik panas diberi garis tepi tebal
+        trace['marker'] = {
+            'opacity': 0.6,
+            'line': {
+                'width': np.where(values['cluster'], 3, 1).tolist(),
+                'color': np.where(values['cluster'], CLUSTER_LINE_COLOR, '#ffffff').tolist(),
+            },
+        }
+        return trace
+
+    def animated_figure(self, matrix, title, frame_label):
+        """
+        Satu figure dengan frame per bulan, slider dan tombol play.
+
+        Semua frame hanya berisi array nilai (z/customdata); GeoJSON ada sekali
+        di trace awal, sehingga playback berjalan di browser tanpa rerun.
+
+        Args:
+            matrix: hasil month_matrix()
+            frame_label: fungsi (bulan, musim) -> label slider
+        """
+        labels = [frame_label(m, s) for m, s in zip(matrix['months'], matrix['seasons'])]
+        rows = [
+            {key: matrix[key][i] for key in MONTH_KEYS}
+            for i in range(len(labels))
+        ]
+        frames = [
+            {'name': label,
+             'data': [{'type': trace['type'], 'z': trace['z'], 'customdata': trace['customdata'],
+                       'marker': trace['marker']}],
+             'layout': {'title': {'text': f'{title} - {label}'}}}
+            for label, trace in zip(labels, (self.trace(row) for row in rows))
+        ]
+
+        layout = copy.deepcopy(self._base_layout)
+        layout['title'] = {'text': f'{title} - {labels[0]}' if labels else title}
+        transition = {'frame': {'duration': 800, 'redraw': True},
+                      'transition': {'duration': 0}, 'mode': 'immediate'}
+        layout['updatemenus'] = [{
+            'type': 'buttons',
+            'showactive': False,
+            'x': 0.05, 'y': 0.02, 'xanchor': 'left', 'yanchor': 'bottom',
+            'buttons': [
+                {'label': '▶ Putar', 'method': 'animate',
+                 'args': [None, dict(transition, fromcurrent=True)]},
+                {'label': '⏸ Jeda', 'method': 'animate',
+                 'args': [[None], {'frame': {'duration': 0, 'redraw': False}, 'mode': 'immediate'}]},
+            ],
+        }]
+        layout['sliders'] = [{
+            'active': 0,
+            'x': 0.2, 'len': 0.78, 'y': 0.02, 'yanchor': 'bottom',
+            'currentvalue': {'prefix': 'Bulan: '},
+            'steps': [
+                {'label': label, 'method': 'animate', 'args': [[label], transition]}
+                for label in labels
+            ],
+        }]
+
+        data = [self.trace(rows[0])] if rows else []
+        return {'data': data, 'layout': layout, 'frames': frames}
+
+    def figure(self, values, title):
+        """Figure (dict Plotly) untuk satu bulan"""
+        layout = copy.deepcopy(self._base_layout)
+        layout['title'] = {'text': title}
+        return {'data': [self.trace(values)], 'layout': layout}
@@ -1,48 +1,53 @@
+import os
+import sys
+
 import pandas as pd
-import numpy as np
 import json
 
-def load_quartile_thresholds():
+# Fungsi inti threshold ada di modul quartile_thresholds.py (folder dashboard)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from quartile_thresholds import CATEGORY_LABELS, QUARTILES, categorize_matrix, category_codes, \
+    compute_quartile_thresholds, thresholds_to_array, thresholds_to_dict
+
+
+def training_rows(df, year=None, window=None):
+    """
+    Pilih baris data latih threshold (index year_month bertipe datetime).
+
+    Args:
+        year: tahun data latih (mis. 2025)
+        window: tuple (awal, akhir) 'YYYY-MM' inklusif; dipakai jika year None
+    """
+    if year is not None:
+        return df[df.index.year == year]
+    if window is not None:
+        start, end = (pd.Timestamp(bound) for bound in window)
+        return df[(df.index >= start) & (df.index <= end)]
+    return df
+
+
+def load_quartile_thresholds(path='monthly_hotspot_forecasts_2025_new.csv', year=2025, window=None):
     """
     Load quartile thresholds from 2024 data
     """
     # Read the monthly hotspot data
-    df = pd.read_csv('monthly_hotspot_forecasts_2025_new.csv')
+    df = pd.read_csv(path)
     df['year_month'] = pd.to_datetime(df['year_month'])
     df = df.set_index('year_month')
     
     # Filter data for 2024 to calculate quartiles
-    train_data = df[(df.index.year == 2025)]
+    train_data = training_rows(df, year, window)
     
     # Get tile columns
     tile_columns = [col for col in df.columns if col.startswith('tile_')]
     
-    # Calculate quartiles for each tile
-    quartile_thresholds = {}
-    
-    for tile in tile_columns:
-        # Get non-zero values for quartile calculation
-        non_zero_values = train_data[tile][train_data[tile] > 0]
-        
-        if len(non_zero_values) > 0:
-            q25 = non_zero_values.quantile(0.25)
-            q50 = non_zero_values.quantile(0.50)
-            q75 = non_zero_values.quantile(0.75)
-            
-            quartile_thresholds[tile] = {
-                'q25': float(q25),
-                'q50': float(q50),
-                'q75': float(q75)
-            }
-        else:
-            # If no activity, set thresholds to 0
-            quartile_thresholds[tile] = {
-                'q25': 0.0,
-                'q50': 0.0,
-                'q75': 0.0
-            }
+    # Calculate quartiles for all tiles at once
+    quartiles = compute_quartile_thresholds(train_data[tile_columns].to_numpy())
     
-    return quartile_thresholds
+    return thresholds_to_dict(tile_columns, quartiles)
 
 
 def categorize_prediction(value, thresholds):
@@ -75,11 +80,12 @@ def apply_thresholds_to_predictions(predictions_df, thresholds):
     """
     categorical_predictions = predictions_df.copy()
     
-    for tile in predictions_df.columns:
-        if tile in thresholds:
-            categorical_predictions[tile] = predictions_df[tile].apply(
-                lambda x: categorize_prediction(x, thresholds[tile])
-            )
+    tiles = [tile for tile in predictions_df.columns if tile in thresholds]
+    if tiles:
+        categorical_predictions[tiles] = categorize_matrix(
+            predictions_df[tiles].to_numpy(dtype=float),
+            thresholds_to_array(thresholds, tiles)
+        )
     
     return categorical_predictions
 
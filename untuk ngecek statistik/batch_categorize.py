@@ -0,0 +1,199 @@
+"""
+Batch kategorisasi banyak file forecast sekaligus.
+
+Contoh:
+    python batch_categorize.py                         # semua *forecast*.csv di folder ini
+    python batch_categorize.py a.csv b.csv --year 2025
+    python batch_categorize.py a.csv --thresholds monthly_hotspot_sum.csv --window 2023-01 2024-12
+
+Setiap file forecast dikategorikan (Low/Medium/High) dengan threshold kuartil
+per tile dari sumber threshold (default: file itu sendiri, tahun 2025). File
+diproses paralel di process pool. Hasil: categorical_<nama>.csv per file dan
+ringkasan JSON (jumlah kategori per tile/bulan, tile High/Medium per bulan).
+"""
+import argparse
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import numpy as np
+
+from apply_categorical_thresholds import categorize_matrix, load_quartile_thresholds, \
+    thresholds_to_array
+
+CATEGORIES = ['High', 'Medium', 'Low']
+DEFAULT_PATTERN = '*forecast*.csv'
+DEFAULT_YEAR = 2025
+SUMMARY_FILE = 'categorization_summary.json'
+OUTPUT_PREFIX = 'categorical_'
+
+
+def discover_forecasts(directory='.', pattern=DEFAULT_PATTERN):
+    """File forecast numerik di directory (hasil kategorisasi tidak ikut)"""
+    return [
+        path for path in sorted(glob.glob(os.path.join(directory, pattern)))
+        if not os.path.basename(path).startswith(OUTPUT_PREFIX)
+    ]
+
+
+def read_forecast(path):
+    """Baca file forecast wide (year_month x tile_N) dengan index datetime"""
+    df = pd.read_csv(path)
+    df['year_month'] = pd.to_datetime(df['year_month'])
+    return df.set_index('year_month')
+
+
+def output_path(path, output_dir):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(output_dir, f'{OUTPUT_PREFIX}{name}.csv')
+
+
+def summarize(values_df, categorical_df):
+    """
+    Ringkasan kategori secara vektorisasi (tanpa loop per sel).
+
+    Returns:
+        dict berisi total per kategori, jumlah per tile, jumlah per bulan,
+        tile High/Medium per bulan dan tile aktif (nilai maksimum >= 0.5)
+    """
+    labels = categorical_df.to_numpy(dtype=object)
+    tiles = np.asarray(categorical_df.columns)
+    months = categorical_df.index.strftime('%Y-%m')
+    one_hot = labels[..., np.newaxis] == np.asarray(CATEGORIES, dtype=object)   # bulan x tile x kategori
+
+    per_tile = one_hot.sum(axis=0)
+    per_month = one_hot.sum(axis=1)
+    total = one_hot.sum(axis=(0, 1))
+    n_cells = labels.size
+
+    high = one_hot[..., CATEGORIES.index('High')]
+    medium = one_hot[..., CATEGORIES.index('Medium')]
+    active = values_df[categorical_df.columns].to_numpy(dtype=float).max(axis=0) >= 0.5
+
+    return {
+        'total': {
+            cat: {'count': int(total[i]), 'percent': round(float(total[i]) / n_cells * 100, 1)}
+            for i, cat in enumerate(CATEGORIES)
+        },
+        'per_tile': {
+            tile: dict(zip(CATEGORIES, counts.tolist())) for tile, counts in zip(tiles, per_tile)
+        },
+        'per_month': {
+            month: dict(zip(CATEGORIES, counts.tolist())) for month, counts in zip(months, per_month)
+        },
+        'high_risk_months': {
+            month: {'High': tiles[h].tolist(), 'Medium': tiles[m].tolist()}
+            for month, h, m in zip(months, high, medium) if h.any() or m.any()
+        },
+        'active_tiles': tiles[active].tolist(),
+    }
+
+
+def categorize_file(path, threshold_source=None, year=DEFAULT_YEAR, window=None, output_dir='.',
+                    output_file=None):
+    """
+    Kategorikan satu file forecast lalu simpan matriks kategorinya
+    (ke output_file, atau categorical_<nama>.csv di output_dir).
+
+    Returns:
+        dict ringkasan (JSON-serializable) untuk file tersebut
+    """
+    threshold_source = threshold_source or path
+    thresholds = load_quartile_thresholds(threshold_source, year=year, window=window)
+
+    values_df = read_forecast(path)
+    tiles = [col for col in values_df.columns if col in thresholds]
+    categorical_df = pd.DataFrame(
+        categorize_matrix(values_df[tiles].to_numpy(dtype=float), thresholds_to_array(thresholds, tiles)),
+        index=values_df.index, columns=tiles
+    )
+
+    out_path = output_file or output_path(path, output_dir)
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    categorical_df.to_csv(out_path)
+
+    return {
+        'forecast_file': path,
+        'output_file': out_path,
+        'threshold_source': threshold_source,
+        'threshold_year': year,
+        'threshold_window': list(window) if window else None,
+        'months': [values_df.index.min().strftime('%Y-%m'), values_df.index.max().strftime('%Y-%m')],
+        'thresholds': thresholds,
+        'summary': summarize(values_df, categorical_df),
+    }
+
+
+def _categorize_task(task):
+    return categorize_file(*task)
+
+
+def run_batch(paths, threshold_source=None, year=DEFAULT_YEAR, window=None, output_dir='.',
+              max_workers=None, summary_file=SUMMARY_FILE):
+    """
+    Kategorikan banyak file forecast paralel di process pool.
+
+    Returns:
+        list ringkasan per file (urutan sama dengan paths); juga ditulis ke
+        summary_file di output_dir jika summary_file tidak None
+    """
+    tasks = [(path, threshold_source, year, window, output_dir) for path in paths]
+    if max_workers == 1 or len(tasks) <= 1:
+        results = [_categorize_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_categorize_task, tasks))
+
+    if summary_file is not None:
+        with open(os.path.join(output_dir, summary_file), 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+def print_summary(result):
+    """Cetak ringkasan singkat satu file (total kategori dan bulan berisiko)"""
+    summary = result['summary']
+    print(f"{result['forecast_file']} -> {result['output_file']}")
+    for cat, stats in summary['total'].items():
+        print(f"  {cat}: {stats['count']} ({stats['percent']:.1f}%)")
+    risky = summary['high_risk_months']
+    if risky:
+        months = ', '.join(
+            f"{month} (H{len(tiles['High'])}/M{len(tiles['Medium'])})" for month, tiles in risky.items()
+        )
+        print(f"  Bulan High/Medium: {months}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Batch kategorisasi file forecast titik panas')
+    parser.add_argument('files', nargs='*', help='File forecast (default: semua *forecast*.csv)')
+    parser.add_argument('--thresholds', default=None,
+                        help='File sumber threshold (default: file forecast itu sendiri)')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--year', type=int, default=None,
+                       help=f'Tahun data latih threshold (default: {DEFAULT_YEAR})')
+    group.add_argument('--window', nargs=2, metavar=('AWAL', 'AKHIR'),
+                       help='Rentang bulan data latih threshold, mis. 2023-01 2024-12')
+    parser.add_argument('--output-dir', default='.', help='Folder output')
+    parser.add_argument('--workers', type=int, default=None, help='Jumlah proses paralel')
+    parser.add_argument('--quiet', action='store_true', help='Tanpa ringkasan di terminal')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    paths = args.files or discover_forecasts()
+    year = args.year if args.year is not None or args.window else DEFAULT_YEAR
+    results = run_batch(paths, args.thresholds, year, tuple(args.window) if args.window else None,
+                        args.output_dir, args.workers)
+    if not args.quiet:
+        for result in results:
+            print_summary(result)
+        print(f"Ringkasan JSON: {os.path.join(args.output_dir, SUMMARY_FILE)}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
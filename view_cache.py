@@ -0,0 +1,100 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import numpy as np
+
+# Batas memori default cache view (MB), bisa diubah lewat environment variable
+DEFAULT_MAX_MB = 256
+MAX_MB_ENV = 'DASHBOARD_VIEW_CACHE_MB'
+
+
+def estimate_size(obj):
+    """Perkiraan ukuran memori (byte) hasil view"""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True, index=True)
+        return int(usage.sum()) if isinstance(obj, pd.DataFrame) else int(usage)
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+def normalize_filters(areas, start, end, page=None, map_month=None):
+    """Tuple filter yang ternormalisasi (area terurut, bulan awal/akhir, halaman, bulan peta)"""
+    def month(value):
+        return None if value is None else pd.Timestamp(value).strftime('%Y-%m')
+
+    areas_key = tuple(sorted(areas)) if areas else ()
+    return (areas_key, month(start), month(end), page, month(map_month))
+
+
+class ViewCache:
+    """
+    Cache LRU untuk view yang bergantung pada filter sidebar.
+
+    Dipakai bersama oleh semua sesi (lewat st.cache_resource). Ketika total
+    ukuran view melebihi max_bytes, view yang paling lama tidak dipakai
+    dibuang. Nilai yang disimpan dipakai bersama, jadi pemanggil tidak boleh
+    mengubahnya (mutasi) setelah diambil dari cache.
+    """
+
+    def __init__(self, max_bytes=None):
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        """Ambil view dari cache, atau hitung dengan compute() lalu simpan"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        value = compute()
+        size = estimate_size(value)
+
+        with self._lock:
+            if size > self.max_bytes:
+                # View lebih besar dari batas cache: jangan disimpan
+                return value
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+        return value
+
+    def clear(self):
+        """Kosongkan cache"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """Statistik cache (jumlah entri, ukuran, hit/miss)"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
@@ -0,0 +1,120 @@
+import numpy as np
+
+# Seed default agar hasil simulasi identik di semua proses/worker
+DEFAULT_SEED = 20250101
+
+# Bulan acuan untuk indeks stream noise (ordinal bulan = 0 pada Januari 2000)
+EPOCH_YEAR = 2000
+
+# Kode sumber data untuk memisahkan stream noise Realisasi dan Prakiran
+SOURCE_CODES = {'Realisasi': 0, 'Prakiran': 1}
+
+# Setiap kolom punya stream Generator sendiri, sehingga menambah kolom baru
+# tidak menggeser noise kolom lain
+NOISE_COLUMNS = {
+    'curah_hujan': 1,
+    'suhu': 2,
+    'kelembaban': 3,
+    'sinaran_matahari': 4,
+    'kecepatan_angin': 5,
+    'arah_angin': 6,
+    'ispu': 7,
+}
+
+
+def month_ordinal(dates):
+    """Ordinal bulan sejak Januari EPOCH_YEAR untuk array datetime64"""
+    months = np.asarray(dates, dtype='datetime64[M]').astype(np.int64)
+    ordinal = months - (EPOCH_YEAR - 1970) * 12
+    if np.any(ordinal < 0):
+        raise ValueError(f"Tanggal sebelum {EPOCH_YEAR} tidak didukung untuk simulasi cuaca")
+    return ordinal
+
+
+class NoiseField:
+    """
+    Noise normal standar yang deterministik per sel (bulan, sumber, tile).
+
+    Untuk tiap kolom dibuat satu numpy.random.Generator dari (seed, kolom) dan
+    seluruh grid bulan x sumber x tile ditarik dalam satu panggilan. Nilai untuk
+    satu sel hanya bergantung pada seed dan posisinya di grid, sehingga hasilnya
+    sama di semua proses dan tidak berubah ketika bulan lain ditambahkan.
+    """
+
+    def __init__(self, seed, ordinal, source_code, tile_pos, n_tiles):
+        self.seed = seed
+        self.ordinal = ordinal
+        self.source_code = source_code
+        self.tile_pos = tile_pos
+        self.shape = (int(ordinal.max()) + 1, len(SOURCE_CODES), n_tiles)
+
+    def standard_normal(self, column):
+        rng = np.random.default_rng([self.seed, NOISE_COLUMNS[column]])
+        grid = rng.standard_normal(self.shape)
+        return grid[self.ordinal, self.source_code, self.tile_pos]
+
+
+def synthesize_weather(hotspot, is_dry, real_weather, noise):
+    """
+    Hitung kolom cuaca dan ISPU per baris (vektorisasi).
+
+    Args:
+        hotspot: array jumlah titik panas per baris
+        is_dry: array boolean musim kemarau per baris
+        real_weather: dict array 'rainfall', 'solar_radiation', 'wind_speed'
+            dari data Kuburaya Dalam Angka (NaN jika tidak tersedia)
+        noise: NoiseField untuk baris yang sama
+
+    Returns:
+        dict kolom curah_hujan, sinaran_matahari, kecepatan_angin, arah_angin,
+        suhu, kelembaban, ispu
+    """
+    real_rainfall = real_weather['rainfall']
+    real_solar = real_weather['solar_radiation']
+    real_wind = real_weather['wind_speed']
+    has_weather = ~np.isnan(real_rainfall)
+
+    z_rain = noise.standard_normal('curah_hujan')
+    z_temp = noise.standard_normal('suhu')
+    z_hum = noise.standard_normal('kelembaban')
+    z_solar = noise.standard_normal('sinaran_matahari')
+    z_wind = noise.standard_normal('kecepatan_angin')
+    z_dir = noise.standard_normal('arah_angin')
+    z_ispu = noise.standard_normal('ispu')
+
+    # Data cuaca real (jika tersedia)
+    solar_fallback = np.where(is_dry, 450.0, 350.0)
+    wind_fallback = np.where(is_dry, 3.5, 2.8)
+    real_temperature = np.where(
+        is_dry, 28 - real_rainfall / 100, 27 - real_rainfall / 150
+    ) + z_temp * 0.5
+    real_humidity = np.clip(75 + real_rainfall / 20 + z_hum * 3, 60, 95)
+
+    # Simulasi untuk 2025 atau data yang hilang
+    sim_rainfall = np.maximum(0, np.where(
+        is_dry, 120 - hotspot * 10 + z_rain * 30, 280 - hotspot * 5 + z_rain * 50
+    ))
+    sim_temperature = np.where(is_dry, 28 + hotspot * 0.1, 27 + hotspot * 0.05) + z_temp
+    sim_humidity = np.where(
+        is_dry,
+        np.maximum(60, 75 - hotspot * 0.5 + z_hum * 5),
+        np.maximum(70, 85 - hotspot * 0.3 + z_hum * 5)
+    )
+    sim_solar = solar_fallback + z_solar * 40
+    sim_wind = wind_fallback + z_wind
+
+    return {
+        'curah_hujan': np.where(has_weather, real_rainfall, sim_rainfall),
+        'sinaran_matahari': np.where(
+            has_weather, np.where(np.isnan(real_solar), solar_fallback, real_solar), sim_solar
+        ),
+        'kecepatan_angin': np.where(
+            has_weather, np.where(np.isnan(real_wind), wind_fallback, real_wind), sim_wind
+        ),
+        # Wind direction based on season (real data often shows T/A - not available)
+        'arah_angin': (np.where(is_dry, 120.0, 240.0) + z_dir * 30) % 360,
+        'suhu': np.where(has_weather, real_temperature, sim_temperature),
+        'kelembaban': np.where(has_weather, real_humidity, sim_humidity),
+        # ISPU calculation
+        'ispu': np.maximum(0, np.trunc(45 + hotspot * 3 + z_ispu * 10)).astype(int),
+    }